@@ -1,3 +1,5 @@
+import asyncio
+import sqlite3
 import streamlit as st
 import tempfile
 import os
@@ -5,6 +7,67 @@ import pandas as pd
 from pathlib import Path
 from main import EmailScraper
 import time
+try:
+    from pybloom_live import ScalableBloomFilter
+    PYBLOOM_AVAILABLE = True
+except ImportError:
+    PYBLOOM_AVAILABLE = False
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+
+class HashedSeenSet:
+    """Membership set that stores 128-bit xxhash digests, not the strings.
+
+    ~16 bytes per email instead of ~80-100 for a raw-string set, with a
+    collision probability around 1e-20 at a billion entries, and __hash__
+    on a native int is cheaper than re-hashing the string.
+    """
+    __slots__ = ('_hashes',)
+
+    def __init__(self):
+        self._hashes = set()
+
+    def __contains__(self, email):
+        return xxhash.xxh128_intdigest(email.encode('utf-8')) in self._hashes
+
+    def add(self, email):
+        self._hashes.add(xxhash.xxh128_intdigest(email.encode('utf-8')))
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+try:
+    from docx import Document
+    DOCX_AVAILABLE = True
+except ImportError:
+    Document = None
+    DOCX_AVAILABLE = False
+
+# Probe Excel engines without importing them: pandas imports the chosen
+# engine lazily on first use, so no import cost is paid until a read or a
+# download actually happens (Streamlit re-runs this script on every widget)
+import importlib.util
+EXCEL_READ_ENGINE = ('calamine'  # rust Excel reader, 10-30x openpyxl
+                     if importlib.util.find_spec('python_calamine') is not None
+                     else 'openpyxl')
+if importlib.util.find_spec('xlsxwriter') is not None:
+    # streaming writer, O(1) row memory
+    EXCEL_WRITER_KWARGS = {'engine': 'xlsxwriter',
+                           'engine_kwargs': {'options': {'constant_memory': True}}}
+else:
+    EXCEL_WRITER_KWARGS = {'engine': 'openpyxl'}
+
+# Arrow-backed columns avoid per-cell Python object allocation on big sheets
+EXCEL_READ_KWARGS = {'engine': EXCEL_READ_ENGINE}
+if PYARROW_AVAILABLE:
+    EXCEL_READ_KWARGS['dtype_backend'] = 'pyarrow'
 
 # Check for undetected_chromedriver availability
 try:
@@ -28,27 +91,224 @@ def combine_results(all_results):
         'output_files': {}
     }
     
-    all_emails = set()
-    
+    # Compact dedup for huge multi-file runs: exact 128-bit digests when
+    # xxhash is installed, a Bloom filter next, a plain set as last resort
+    if XXHASH_AVAILABLE:
+        seen_emails = HashedSeenSet()
+    elif PYBLOOM_AVAILABLE:
+        seen_emails = ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-6)
+    else:
+        seen_emails = set()
+    unique_count = 0
+
     for result in all_results:
         combined['total_urls_processed'] += result.get('total_urls_processed', 0)
         combined['successful_scrapes'] += result.get('successful_scrapes', 0)
         combined['failed_scrapes'] += result.get('failed_scrapes', 0)
-        
+
         # Collect emails
         for detail_result in result.get('detailed_results', []):
             combined['detailed_results'].append(detail_result)
             for email in detail_result.get('emails', []):
-                all_emails.add(email)
-    
-    combined['total_emails_found'] = len(all_emails)
-    combined['unique_emails_found'] = len(all_emails)
+                if email not in seen_emails:
+                    seen_emails.add(email)
+                    unique_count += 1
+
+    combined['total_emails_found'] = unique_count
+    combined['unique_emails_found'] = unique_count
     
     if combined['total_urls_processed'] > 0:
         combined['success_rate'] = (combined['successful_scrapes'] / combined['total_urls_processed']) * 100
     
     return combined
 
+def save_upload_to_disk(uploaded_file):
+    """Stream an uploaded file to a temp file in 1 MiB chunks.
+
+    Avoids loading multi-GB uploads into RAM; preview and extraction
+    re-open the on-disk path instead of re-reading the in-memory buffer.
+    The target name is derived from a content hash, so the same upload
+    maps to the same path across Streamlit reruns and the cached parsers
+    below get stable cache keys.
+    """
+    import hashlib
+    suffix = Path(uploaded_file.name).suffix
+    uploaded_file.seek(0)
+    digest = hashlib.blake2b(digest_size=16)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        for chunk in iter(lambda: uploaded_file.read(1 << 20), b''):
+            digest.update(chunk)
+            tmp.write(chunk)
+    target = os.path.join(tempfile.gettempdir(),
+                          f"email_scraper_upload_{digest.hexdigest()}{suffix}")
+    os.replace(tmp.name, target)
+    return target
+
+
+@st.cache_data(show_spinner=False)
+def load_tabular_preview(path, is_csv):
+    """Load the first 10 rows of a CSV/Excel upload (cached per path)."""
+    if is_csv:
+        if PYARROW_AVAILABLE:
+            # Stream just the first batch instead of spinning up the
+            # full pandas parser stack for a 10-row preview
+            reader = pacsv.open_csv(
+                path, read_options=pacsv.ReadOptions(block_size=1 << 16))
+            return reader.read_next_batch().to_pandas().head(10)
+        return pd.read_csv(path, nrows=10)
+    return pd.read_excel(path, engine=EXCEL_READ_ENGINE, nrows=10)
+
+
+@st.cache_data(show_spinner=False)
+def load_text_preview(path):
+    """Load the first 10 lines of a TXT upload (first 64 KiB only)."""
+    with open(path, 'rb') as f:
+        content = f.read(65536).decode('utf-8', errors='ignore').splitlines()
+    return '\n'.join(content[:10])
+
+
+@st.cache_data(show_spinner=False)
+def load_docx_preview(path):
+    """Load the first 10 paragraphs of a DOCX upload (cached per path)."""
+    doc = Document(path)
+    return '\n'.join([para.text for para in doc.paragraphs][:10])
+
+
+@st.cache_data(show_spinner=False)
+def extract_urls_from_path(path, name, col):
+    """Extract the URL list from a saved upload (cached per path+column).
+
+    Streamlit reruns the whole script on every widget change; caching
+    here means each upload is parsed once, not once per interaction.
+    """
+    if name.endswith('.csv'):
+        if PYARROW_AVAILABLE:
+            # Multi-threaded C++ reader; pull only the URL column
+            convert_options = (
+                pacsv.ConvertOptions(include_columns=[col]) if col else None)
+            table = pacsv.read_csv(path, convert_options=convert_options)
+            return [str(v) for v in table.column(0).to_pylist() if v is not None]
+        df = pd.read_csv(path)
+        if col is None:
+            col = df.columns[0]
+        return df[col].dropna().astype(str).tolist()
+    if name.endswith('.xlsx') or name.endswith('.xls'):
+        df = pd.read_excel(path, **EXCEL_READ_KWARGS)
+        if col is None:
+            col = df.columns[0]
+        return df[col].dropna().astype(str).tolist()
+    if name.endswith('.txt'):
+        # Stream line by line instead of slurping the whole file
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            return [line.strip() for line in f if line.strip()]
+    if name.endswith('.docx') and DOCX_AVAILABLE:
+        doc = Document(path)
+        return [para.text.strip() for para in doc.paragraphs if para.text.strip()]
+    return []
+
+RESULT_COLUMNS = ['URL', 'Email', 'Source Page', 'Status', 'Source Type']
+
+
+def iter_email_rows(results):
+    """Yield one display/export row per (url, email) pair."""
+    for result in results.get('detailed_results', []):
+        if result is None:
+            continue
+        url = result.get('url', '')
+        source_page = result.get('source_page', '')
+        status = result.get('status', '')
+        source_type = result.get('source_type', '')
+        for email in result.get('emails', []) or ['']:
+            yield {
+                'URL': url,
+                'Email': email,
+                'Source Page': source_page,
+                'Status': status,
+                'Source Type': source_type
+            }
+
+
+RESULTS_DB_PATH = os.path.join(tempfile.gettempdir(), 'email_scraper_results.db')
+RESULTS_PAGE_SIZE = 1000
+
+
+def store_results_in_db(results, batch_size=1000):
+    """Persist result rows to SQLite so the UI can page through them.
+
+    WAL mode keeps inserts cheap, and the table below reads windows with
+    LIMIT/OFFSET, so browser and server memory stay bounded no matter
+    how large the crawl was.
+    """
+    con = sqlite3.connect(RESULTS_DB_PATH)
+    try:
+        con.execute('PRAGMA journal_mode=WAL')
+        con.execute(
+            'CREATE TABLE IF NOT EXISTS results '
+            '(url TEXT, email TEXT, source_page TEXT, status TEXT, source_type TEXT)')
+        con.execute('DELETE FROM results')
+        rows = []
+        for row in iter_email_rows(results):
+            rows.append(tuple(row[name] for name in RESULT_COLUMNS))
+            if len(rows) >= batch_size:
+                con.executemany('INSERT INTO results VALUES (?, ?, ?, ?, ?)', rows)
+                rows = []
+        if rows:
+            con.executemany('INSERT INTO results VALUES (?, ?, ?, ?, ?)', rows)
+        con.commit()
+    finally:
+        con.close()
+
+
+def count_results_in_db():
+    """Return (total_rows, distinct_non_empty_emails) from the store."""
+    con = sqlite3.connect(RESULTS_DB_PATH)
+    try:
+        return con.execute(
+            "SELECT count(*), count(DISTINCT CASE WHEN email != '' THEN email END) "
+            'FROM results').fetchone()
+    finally:
+        con.close()
+
+
+def load_results_page(page, page_size=RESULTS_PAGE_SIZE):
+    """Load one page of result rows as a DataFrame."""
+    con = sqlite3.connect(RESULTS_DB_PATH)
+    try:
+        return pd.read_sql_query(
+            'SELECT url AS "URL", email AS "Email", source_page AS "Source Page", '
+            'status AS "Status", source_type AS "Source Type" '
+            'FROM results LIMIT ? OFFSET ?',
+            con, params=(page_size, page * page_size))
+    finally:
+        con.close()
+
+
+def export_results_to_files(results, batch_size=10_000):
+    """Stream result rows to Parquet and CSV files in bounded batches.
+
+    Keeps export memory at O(batch_size) instead of materializing one
+    giant DataFrame per download; the Parquet writer also compresses
+    with zstd so the downloaded artifact stays small.
+    """
+    parquet_path = os.path.join(tempfile.gettempdir(), 'extracted_emails.parquet')
+    csv_path = os.path.join(tempfile.gettempdir(), 'extracted_emails.csv')
+    schema = pa.schema([(name, pa.string()) for name in RESULT_COLUMNS])
+    with pq.ParquetWriter(parquet_path, schema, compression='zstd') as parquet_writer, \
+            pacsv.CSVWriter(csv_path, schema) as csv_writer:
+        rows = []
+        for row in iter_email_rows(results):
+            rows.append(row)
+            if len(rows) >= batch_size:
+                batch = pa.RecordBatch.from_pylist(rows, schema=schema)
+                parquet_writer.write_batch(batch)
+                csv_writer.write(batch)
+                rows = []
+        batch = pa.RecordBatch.from_pylist(rows, schema=schema)
+        parquet_writer.write_batch(batch)
+        csv_writer.write(batch)
+    return parquet_path, csv_path
+
+
 # Page configuration
 st.set_page_config(
     page_title="📧 Email Scraper Tool",
@@ -156,34 +416,42 @@ with col1:
         st.subheader("📋 File Details")
         st.dataframe(pd.DataFrame(file_details), use_container_width=True)
 
+        # Stream each upload to disk once; preview and extraction below
+        # re-open the path instead of re-reading the in-memory buffer
+        saved_paths = {}
+        for file in uploaded_files:
+            try:
+                saved_paths[file.name] = save_upload_to_disk(file)
+            except Exception as e:
+                st.error(f"Could not save {file.name}: {e}")
+
         # --- File Preview Section ---
         st.subheader("👀 File Preview")
         url_column_choices = {}
         for file in uploaded_files:
             st.markdown(f"**{file.name}**")
+            path = saved_paths.get(file.name)
+            if not path:
+                continue
             try:
-                file.seek(0)
                 if file.name.endswith('.csv'):
-                    df = pd.read_csv(file, nrows=10)
+                    df = load_tabular_preview(path, is_csv=True)
                     st.dataframe(df, use_container_width=True)
                     url_column_choices[file.name] = list(df.columns)
                 elif file.name.endswith('.xlsx') or file.name.endswith('.xls'):
                     try:
-                        df = pd.read_excel(file, engine='openpyxl', nrows=10)
+                        df = load_tabular_preview(path, is_csv=False)
                         st.dataframe(df, use_container_width=True)
                         url_column_choices[file.name] = list(df.columns)
                     except Exception as e:
                         st.error(f"Excel preview failed: {e}")
                 elif file.name.endswith('.txt'):
-                    content = file.read().decode('utf-8', errors='ignore').splitlines()
-                    preview = '\n'.join(content[:10])
-                    st.text(preview)
+                    st.text(load_text_preview(path))
                 elif file.name.endswith('.docx'):
-                    from docx import Document
-                    import io
-                    doc = Document(io.BytesIO(file.read()))
-                    text = '\n'.join([para.text for para in doc.paragraphs][:10])
-                    st.text(text)
+                    if not DOCX_AVAILABLE:
+                        st.warning("python-docx is not installed; cannot preview DOCX.")
+                        continue
+                    st.text(load_docx_preview(path))
                 else:
                     st.warning("Unsupported file type for preview.")
             except Exception as e:
@@ -200,30 +468,13 @@ with col1:
         extracted_urls = []
         url_extraction_map = {}  # Map file name to list of URLs for scraping
         for file in uploaded_files:
-            file.seek(0)
+            path = saved_paths.get(file.name)
+            if not path:
+                continue
             try:
-                if file.name.endswith('.csv'):
-                    df = pd.read_csv(file)
-                    col = url_column_selection.get(file.name, df.columns[0])
-                    urls = df[col].dropna().astype(str).tolist()
-                    extracted_urls.extend(urls)
-                    url_extraction_map[file.name] = urls
-                elif file.name.endswith('.xlsx') or file.name.endswith('.xls'):
-                    df = pd.read_excel(file, engine='openpyxl')
-                    col = url_column_selection.get(file.name, df.columns[0])
-                    urls = df[col].dropna().astype(str).tolist()
-                    extracted_urls.extend(urls)
-                    url_extraction_map[file.name] = urls
-                elif file.name.endswith('.txt'):
-                    content = file.read().decode('utf-8', errors='ignore').splitlines()
-                    urls = [line.strip() for line in content if line.strip()]
-                    extracted_urls.extend(urls)
-                    url_extraction_map[file.name] = urls
-                elif file.name.endswith('.docx'):
-                    from docx import Document
-                    import io
-                    doc = Document(io.BytesIO(file.read()))
-                    urls = [para.text.strip() for para in doc.paragraphs if para.text.strip()]
+                urls = extract_urls_from_path(
+                    path, file.name, url_column_selection.get(file.name))
+                if urls:
                     extracted_urls.extend(urls)
                     url_extraction_map[file.name] = urls
             except Exception as e:
@@ -257,10 +508,20 @@ with col2:
                 progress_bar = st.progress(0)
                 status_text = st.empty()
             
-            # Collect all URLs from url_extraction_map
-            all_urls = []
-            for urls in url_extraction_map.values():
-                all_urls.extend(urls)
+            # Collect all URLs: one C-level concat + drop_duplicates pass
+            # also removes cross-file duplicates before any network work
+            if url_extraction_map:
+                url_dtype = 'string[pyarrow]' if PYARROW_AVAILABLE else 'string'
+                all_urls = (
+                    pd.concat([pd.Series(urls, dtype=url_dtype)
+                               for urls in url_extraction_map.values()],
+                              ignore_index=True)
+                    .dropna()
+                    .drop_duplicates()
+                    .tolist()
+                )
+            else:
+                all_urls = []
             
             if not all_urls:
                 st.error("No URLs to scrape. Please upload files with valid URLs.")
@@ -273,8 +534,9 @@ with col2:
                         max_internal_pages=max_internal,
                         output_format=output_format
                     ) as scraper:
-                        # Scrape emails from the list of URLs
-                        results = scraper.scrape_from_urls(all_urls)
+                        # Scrape emails from the list of URLs concurrently
+                        results = asyncio.run(scraper.scrape_from_urls_async(all_urls))
+                        store_results_in_db(results)
                         progress_bar.progress(100)
                         status_text.success("Scraping complete!")
                         st.session_state.scraping_results = results
@@ -322,32 +584,18 @@ if st.session_state.get('scraping_complete', False) and st.session_state.get('sc
             st.subheader("🔎 Email Extraction Debug Summary")
             st.dataframe(pd.DataFrame(debug_rows), use_container_width=True)
         
-        # Display emails in a table (always show URL and Email columns)
-        email_data = []
-        for result in results.get('detailed_results', []):
-            if result is not None:
-                url = result.get('url', '')
-                emails = result.get('emails', [])
-                if emails:
-                    for email in emails:
-                        email_data.append({
-                            'URL': url,
-                            'Email': email,
-                            'Source Page': result.get('source_page', ''),
-                            'Status': result.get('status', ''),
-                            'Source Type': result.get('source_type', '')
-                        })
-                else:
-                    email_data.append({
-                        'URL': url,
-                        'Email': '',
-                        'Source Page': result.get('source_page', ''),
-                        'Status': result.get('status', ''),
-                        'Source Type': result.get('source_type', '')
-                    })
-        if email_data:
-            df = pd.DataFrame(email_data)
+        # Display emails in a paginated table backed by the SQLite store
+        # so only one page of rows is ever materialized in the browser
+        total_rows, _ = count_results_in_db()
+        if total_rows:
             st.subheader("📧 Extracted Emails Table")
+            num_pages = (total_rows + RESULTS_PAGE_SIZE - 1) // RESULTS_PAGE_SIZE
+            page = 1
+            if num_pages > 1:
+                page = st.number_input(
+                    f"Page (of {num_pages}, {RESULTS_PAGE_SIZE} rows each)",
+                    min_value=1, max_value=num_pages, value=1)
+            df = load_results_page(page - 1)
             st.dataframe(df, use_container_width=True)
         else:
             st.warning("No emails found for the provided URLs. This may be due to:")
@@ -357,7 +605,24 @@ if st.session_state.get('scraping_complete', False) and st.session_state.get('sc
             st.dataframe(df, use_container_width=True)
         # Download CSV and Excel buttons (always shown)
         st.subheader("💾 Download Results")
-        csv_data = df.to_csv(index=False)
+        if PYARROW_AVAILABLE:
+            # Stream rows straight to disk in 10k-row batches; the CSV
+            # writer is multi-threaded and the Parquet file is zstd-packed
+            parquet_path, csv_path = export_results_to_files(results)
+            with open(csv_path, 'rb') as f:
+                csv_data = f.read()
+            with open(parquet_path, 'rb') as f:
+                st.download_button(
+                    label="🗄️ Download Parquet",
+                    data=f,
+                    file_name="extracted_emails.parquet",
+                    mime="application/octet-stream",
+                    use_container_width=True
+                )
+        else:
+            # Without pyarrow, materialize the full row set just for export
+            csv_data = pd.DataFrame(iter_email_rows(results),
+                                    columns=RESULT_COLUMNS).to_csv(index=False)
         st.download_button(
             label="📄 Download CSV",
             data=csv_data,
@@ -369,8 +634,9 @@ if st.session_state.get('scraping_complete', False) and st.session_state.get('sc
         try:
             import io
             excel_buffer = io.BytesIO()
-            with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Emails')
+            export_df = pd.DataFrame(iter_email_rows(results), columns=RESULT_COLUMNS)
+            with pd.ExcelWriter(excel_buffer, **EXCEL_WRITER_KWARGS) as writer:
+                export_df.to_excel(writer, index=False, sheet_name='Emails')
             excel_data = excel_buffer.getvalue()
             st.download_button(
                 label="📊 Download Excel",
@@ -5,6 +5,7 @@ This script shows various ways to use the tool programmatically.
 """
 
 import logging
+from pathlib import Path
 from main import EmailScraper
 from file_parser import FileParser
 from email_extractor import EmailExtractor
@@ -25,9 +26,9 @@ def example_basic_usage():
         "https://www.google.com"
     ]
     
-    with open('example_urls.txt', 'w') as f:
-        for url in test_urls:
-            f.write(url + '\n')
+    # One write call instead of one per URL
+    Path('example_urls.txt').write_text('\n'.join(test_urls) + '\n',
+                                        encoding='utf-8')
     
     # Initialize and run scraper
     with EmailScraper(
@@ -61,9 +62,9 @@ def example_advanced_usage():
         "https://www.stackoverflow.com"
     ]
     
-    with open('business_urls.txt', 'w') as f:
-        for url in business_urls:
-            f.write(url + '\n')
+    # One write call instead of one per URL
+    Path('business_urls.txt').write_text('\n'.join(business_urls) + '\n',
+                                         encoding='utf-8')
     
     # Initialize scraper with all features
     with EmailScraper(
@@ -149,8 +150,8 @@ def example_custom_configuration():
     print("\n=== Custom Configuration Example ===")
     
     # Create a test file
-    with open('custom_test.txt', 'w') as f:
-        f.write("https://httpbin.org\n")
+    Path('custom_test.txt').write_text("https://httpbin.org\n",
+                                       encoding='utf-8')
     
     # Custom configuration
     config = {
@@ -5,19 +5,38 @@ This module orchestrates the complete email scraping workflow,
 coordinating all other modules to scrape emails from URLs.
 """
 
+import asyncio
 import logging
+import random
+import re
+import threading
 import time
-from typing import List, Dict, Any, Optional
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
+import httpx
+from dataclasses import dataclass, field
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+try:
+    import hishel
+    HISHEL_AVAILABLE = hasattr(hishel, 'AsyncCacheClient')
+except ImportError:
+    HISHEL_AVAILABLE = False
+from urllib.parse import urlsplit, urlunsplit
+
 # Import our modules
-from file_loader import load_urls
-from selenium_scraper import SeleniumScraper
-from email_extractor import extract_emails
-from output_writer import save_results
-from crawler import get_internal_pages
-from proxy_manager import ProxyManager
-import random
+from file_parser import FileParser
+from email_extractor import EmailExtractor, extract_emails_from_html_batch
+from output_writer import OutputWriter
+from scraper import WebScraper, needs_js, parse_html
+from social_scraper import SocialScraper
+from proxy_handler import ProxyHandler
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +45,125 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Keywords marking pages likely to carry contact emails. Matching whole
+# path tokens via set intersection is a C-level hash probe per URL and,
+# unlike substring search, doesn't fire on words that merely embed a
+# keyword (e.g. 'aboutness')
+_RELEVANT_PAGE_KEYWORDS = frozenset({
+    'contact', 'about', 'team', 'company', 'business', 'services',
+    'products', 'careers', 'jobs', 'career', 'staff', 'people',
+    'leadership', 'management',
+})
+_PATH_TOKEN_SPLIT = re.compile(r'[^a-z0-9]+').split
+
+# Output-format membership as frozensets: hash lookup instead of building
+# and scanning a fresh list literal on every call
+_CSV_FORMATS = frozenset({'csv', 'both'})
+_EXCEL_FORMATS = frozenset({'excel', 'both'})
+
+
+@dataclass(slots=True)
+class ScrapeResult:
+    """
+    Per-URL scraping record.
+
+    A slotted dataclass instead of the old 7-key dict: fixed attribute
+    offsets make records several times smaller and faster to read, which
+    matters when a run accumulates hundreds of thousands of them. The
+    dict-style get/[] accessors keep existing consumers (output writers,
+    summaries, the Streamlit app) working unchanged.
+    """
+
+    url: str
+    status: str
+    emails: List[str] = field(default_factory=list)
+    source_type: str = 'main'
+    source_page: str = ''
+    scraping_method: str = ''
+    title: str = ''
+    links: List[str] = field(default_factory=list)
+    error: str = ''
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any):
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return hasattr(self, key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict at serialization boundaries."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+# Bound on the per-scraper HTML-extraction cache; entries are email
+# lists, so memory stays small even at the cap
+_EXTRACT_CACHE_SIZE = 1024
+
+# One Random instance per thread: the module-level random functions all
+# funnel through a single shared Mersenne Twister, which becomes a
+# contention point once many workers draw jitter concurrently
+_thread_local_rng = threading.local()
+
+
+def _rng() -> random.Random:
+    """Return this thread's private Random instance."""
+    rng = getattr(_thread_local_rng, 'rng', None)
+    if rng is None:
+        rng = _thread_local_rng.rng = random.Random()
+    return rng
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Replaces the old fixed time.sleep() pacing: tokens refill at a steady
+    rate and workers only block when the bucket is empty, so the average
+    request rate stays capped while bursts up to `burst` requests go
+    through without waiting.
+    """
+
+    def __init__(self, rate_per_s: float = 1.0, burst: int = 1):
+        """
+        Args:
+            rate_per_s (float): Sustained token refill rate per second
+            burst (int): Maximum tokens the bucket can hold
+        """
+        self.rate_per_s = float(rate_per_s)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.burst),
+            self._tokens + (now - self._last_refill) * self.rate_per_s
+        )
+        self._last_refill = now
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        with self._cond:
+            while True:
+                self._refill()
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                # Jitter the wake-up so drained workers don't all retry
+                # on the same tick
+                wait = (1.0 - self._tokens) / self.rate_per_s
+                self._cond.wait(wait * _rng().uniform(1.0, 1.1))
+
 
 class EmailScraper:
     """
@@ -40,23 +178,36 @@ class EmailScraper:
                  use_proxies: bool = False,
                  use_social_scraping: bool = True,
                  max_internal_pages: int = 5,
-                 output_format: str = 'excel'):
+                 output_format: str = 'excel',
+                 max_workers: int = 8):
         """
         Initialize the EmailScraper.
-        
+
         Args:
             use_selenium (bool): Whether to use Selenium for dynamic content
             use_proxies (bool): Whether to use proxy rotation
             use_social_scraping (bool): Whether to scrape social media profiles
             max_internal_pages (int): Maximum number of internal pages to scrape
             output_format (str): Output format ('csv', 'excel', or 'both')
+            max_workers (int): Concurrent scraping threads for the sync path
         """
         self.use_selenium = use_selenium
         self.use_proxies = use_proxies
         self.use_social_scraping = use_social_scraping
         self.max_internal_pages = max_internal_pages
         self.output_format = output_format
+        self.max_workers = max_workers
         
+        # Extraction cache keyed by content hash: internal pages often
+        # share near-identical HTML (headers/footers, redirect shells),
+        # and a hit skips the whole regex scan
+        self._extract_cache: "OrderedDict[Any, list]" = OrderedDict()
+        self._extract_cache_lock = threading.Lock()
+
+        # Shared limiter: caps the sustained request rate at 1/s across
+        # all workers while letting a fresh pool burst without stalling
+        self._limiter = TokenBucket(rate_per_s=1.0, burst=max_workers)
+
         # Initialize components
         self.file_parser = FileParser()
         self.email_extractor = EmailExtractor()
@@ -72,11 +223,15 @@ class EmailScraper:
     def _initialize_components(self):
         """Initialize all the scraping components."""
         try:
-            # Initialize web scraper
+            # Initialize web scraper; size its browser pool and HTTP
+            # connection pool to the thread pool so parallel workers
+            # don't serialize on one driver or evict each other's
+            # keep-alive connections
             self.scraper = WebScraper(
                 use_selenium=self.use_selenium,
                 headless=True,
-                timeout=30
+                timeout=30,
+                pool_size=self.max_workers
             )
             
             # Initialize social scraper if enabled
@@ -85,7 +240,11 @@ class EmailScraper:
             
             # Initialize proxy handler if enabled
             if self.use_proxies:
-                self.proxy_handler = ProxyHandler(use_free_proxies=True)
+                # Validate up front (and reuse the persisted pool across
+                # runs) so dead free-list IPs don't cost a scrape each
+                self.proxy_handler = ProxyHandler(
+                    use_free_proxies=True, validate_on_start=True
+                )
                 logger.info("Proxy rotation enabled")
             
             logger.info("All components initialized successfully")
@@ -117,19 +276,25 @@ class EmailScraper:
             
             logger.info(f"Found {len(urls)} URLs to process")
             
-            # Step 2: Scrape emails from URLs
+            # Step 2: Scrape emails from URLs, streaming each completed
+            # record to the output sink so file IO hides behind network
+            # waits instead of running as a final serialization pass
             logger.info("Step 2: Scraping emails from URLs...")
-            results = self._scrape_urls(urls)
-            
+            sink = self.output_writer.open_sink(self.output_format)
+            results = self._scrape_urls(urls, sink=sink)
+
             # Step 3: Process social media links if enabled
             if self.use_social_scraping and self.social_scraper:
                 logger.info("Step 3: Processing social media links...")
                 social_results = self._process_social_links(results)
+                for result in social_results:
+                    sink.write(result)
                 results.extend(social_results)
-            
-            # Step 4: Generate output files
+
+            # Step 4: Finalize output files
             logger.info("Step 4: Generating output files...")
-            output_files = self._generate_outputs(results)
+            output_files = sink.close()
+            output_files['report'] = self.output_writer.write_detailed_report(results)
             
             # Step 5: Create summary
             summary = self._create_summary(results, output_files)
@@ -149,6 +314,11 @@ class EmailScraper:
         Returns:
             Dict[str, Any]: Summary and output files
         """
+        if not self.use_selenium:
+            # Static-HTML scrapes don't need browser threads at all:
+            # drive them through the event-loop fetcher, which keeps
+            # hundreds of requests in flight on one OS thread
+            return asyncio.run(self.scrape_from_urls_async(urls))
         results = self._scrape_urls(urls)
         # Process social links if enabled
         if self.use_social_scraping:
@@ -160,108 +330,315 @@ class EmailScraper:
         summary = self._create_summary(results, output_files)
         return summary
     
-    def _scrape_urls(self, urls: List[str]) -> List[Dict[str, Any]]:
+    async def scrape_from_urls_async(self, urls: List[str],
+                                     max_concurrency: int = 20) -> Dict[str, Any]:
         """
-        Scrape emails from a list of URLs.
-        
+        Scrape emails from a list of URLs concurrently (public method).
+
+        Fetches all URLs through a shared httpx.AsyncClient bounded by an
+        asyncio.Semaphore, falling back to Selenium only for pages that
+        could not be fetched statically.
+
         Args:
             urls (List[str]): List of URLs to scrape
-            
+            max_concurrency (int): Maximum number of in-flight requests
+
+        Returns:
+            Dict[str, Any]: Summary and output files
+        """
+        results = await self._scrape_urls_async(urls, max_concurrency)
+        # Process social links if enabled; the social scraper drives its
+        # own batch event loop, so keep it off this loop's thread
+        if self.use_social_scraping:
+            social_results = await asyncio.to_thread(
+                self._process_social_links, results)
+            results.extend(social_results)
+        # Generate output files
+        output_files = self._generate_outputs(results)
+        # Create summary
+        summary = self._create_summary(results, output_files)
+        return summary
+
+    async def _scrape_urls_async(self, urls: List[str],
+                                 max_concurrency: int = 20) -> List[Dict[str, Any]]:
+        """
+        Fetch and extract emails from URLs concurrently.
+
+        Args:
+            urls (List[str]): List of URLs to scrape
+            max_concurrency (int): Maximum number of in-flight requests
+
         Returns:
             List[Dict[str, Any]]: Scraping results
         """
-        results = []
-        
-        for i, url in enumerate(urls, 1):
-            logger.info(f"Processing URL {i}/{len(urls)}: {url}")
-            
-            try:
-                # Scrape the main URL
-                main_result = self._scrape_single_url(url)
-                results.append(main_result)
-                
-                # If successful, scrape internal pages
-                if main_result['status'] == 'success':
-                    internal_results = self._scrape_internal_pages(url)
-                    results.extend(internal_results)
-                
-                # Add delay between requests
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error processing URL {url}: {e}")
-                results.append({
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_with_sem(client: httpx.AsyncClient, url: str):
+            async with semaphore:
+                return await self._fetch(client, url)
+
+        headers = {}
+        if self.scraper is not None:
+            headers['User-Agent'] = self.scraper.ua.random
+
+        async with self._build_async_client(headers) as client:
+            fetched = await asyncio.gather(
+                *[fetch_with_sem(client, url) for url in urls],
+                return_exceptions=True
+            )
+
+        results: List[Optional[Dict[str, Any]]] = []
+        fetched_pages = []  # (position, url, html) for batch extraction
+        for url, outcome in zip(urls, fetched):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"Async fetch failed for {url}: {outcome}")
+                # Fall back to Selenium for pages that need a real browser
+                if self.use_selenium and self.scraper is not None:
+                    results.append(await asyncio.to_thread(self._scrape_single_url, url))
+                else:
+                    results.append({
+                        'url': url,
+                        'status': 'failed',
+                        'emails': [],
+                        'error': str(outcome),
+                        'source_type': 'main'
+                    })
+                continue
+
+            _, html = outcome
+            # Static fetch returned a JS-only shell: route to the pooled
+            # Selenium path rather than extracting from an empty page
+            if self.use_selenium and self.scraper is not None and needs_js(html):
+                results.append(await asyncio.to_thread(self._scrape_single_url, url))
+                continue
+
+            results.append(None)
+            fetched_pages.append((len(results) - 1, url, html))
+
+        # CPU-bound extraction runs across a process pool when the batch is
+        # large enough to amortize worker startup (see email_extractor)
+        if fetched_pages:
+            extracted = await asyncio.to_thread(
+                extract_emails_from_html_batch,
+                [html for _, _, html in fetched_pages],
+                [url for _, url, _ in fetched_pages]
+            )
+            # Title and links come from the same parse the scraper uses;
+            # the links feed social detection downstream
+            parsed = await asyncio.to_thread(
+                lambda: [parse_html(html, url)
+                         for _, url, html in fetched_pages])
+            for (position, url, _), emails_with_context, page in zip(
+                    fetched_pages, extracted, parsed):
+                results[position] = {
                     'url': url,
-                    'status': 'failed',
-                    'emails': [],
-                    'error': str(e),
+                    'status': 'success',
+                    'emails': [email for email, context in emails_with_context],
+                    'source_page': url,
+                    'scraping_method': 'httpx',
+                    'title': page.get('title', ''),
+                    'links': page.get('links', []),
                     'source_type': 'main'
-                })
-        
+                }
+
+        # The sync path follows every successful scrape with its internal
+        # contact/about pages - a core email source - so the async route
+        # runs the same pass, fanned out across threads
+        if self.scraper is not None:
+            successful = [result['url'] for result in results
+                          if result is not None
+                          and result.get('status') == 'success']
+            if successful:
+                internal_batches = await asyncio.gather(
+                    *[asyncio.to_thread(self._scrape_internal_pages, url)
+                      for url in successful])
+                for batch in internal_batches:
+                    results.extend(batch)
+
+        return results
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> Tuple[str, str]:
+        """
+        Fetch a single URL and return (url, html).
+
+        Args:
+            client (httpx.AsyncClient): Shared async HTTP client
+            url (str): URL to fetch
+
+        Returns:
+            Tuple[str, str]: The URL and the response body
+        """
+        response = await client.get(self._normalize_fetch_url(url),
+                                    timeout=30, follow_redirects=True)
+        response.raise_for_status()
+        return url, response.text
+
+    @staticmethod
+    def _build_async_client(headers: Dict[str, str]) -> httpx.AsyncClient:
+        """
+        Build the shared async HTTP client, disk-cached when hishel is
+        installed so repeat URLs short-circuit to a local read.
+        """
+        if HISHEL_AVAILABLE:
+            return hishel.AsyncCacheClient(
+                http2=True,
+                headers=headers,
+                storage=hishel.AsyncFileStorage(base_path='.httpcache'),
+                controller=hishel.Controller(force_cache=True,
+                                             cacheable_methods=['GET'])
+            )
+        return httpx.AsyncClient(http2=True, headers=headers)
+
+    @staticmethod
+    def _normalize_fetch_url(url: str) -> str:
+        """
+        Normalize a URL so equivalent spellings share one cache entry
+        (lowercase host, no trailing slash on non-root paths).
+        """
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return url
+        path = parts.path
+        if path.endswith('/') and len(path) > 1:
+            path = path.rstrip('/')
+        return urlunsplit((parts.scheme, parts.netloc.lower(), path,
+                           parts.query, parts.fragment))
+
+    def _scrape_urls(self, urls: List[str], sink=None) -> List[ScrapeResult]:
+        """
+        Scrape emails from a list of URLs.
+
+        Args:
+            urls (List[str]): List of URLs to scrape
+            sink (OutputSink): Optional incremental writer; each result
+                is pushed to it as soon as its future completes
+
+        Returns:
+            List[Dict[str, Any]]: Scraping results
+        """
+        results = []
+
+        def scrape_one(url: str) -> List[Dict[str, Any]]:
+            # Scrape the main URL, then its internal pages on success;
+            # pacing is handled by the token bucket inside each request
+            batch = [self._scrape_single_url(url)]
+            if batch[0]['status'] == 'success':
+                batch.extend(self._scrape_internal_pages(url))
+            return batch
+
+        # The work is network-bound (HTTP/Selenium round-trips), so
+        # overlapping URLs across threads converts N serial latencies
+        # into roughly N / max_workers
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(scrape_one, url): url for url in urls}
+            for i, future in enumerate(as_completed(futures), 1):
+                url = futures[future]
+                logger.info(f"Processed URL {i}/{len(urls)}: {url}")
+                try:
+                    batch = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing URL {url}: {e}")
+                    batch = [ScrapeResult(url=url, status='failed', error=str(e))]
+                if sink is not None:
+                    for result in batch:
+                        sink.write(result)
+                results.extend(batch)
+
         return results
     
-    def _scrape_single_url(self, url: str) -> Dict[str, Any]:
+    def _scrape_single_url(self, url: str) -> ScrapeResult:
         """
         Scrape a single URL for emails.
-        
+
         Args:
             url (str): URL to scrape
-            
+
         Returns:
-            Dict[str, Any]: Scraping result
+            ScrapeResult: Scraping result record
         """
         try:
             if self.scraper is None:
                 raise RuntimeError("WebScraper is not initialized.")
+            # Wait for a rate-limit token before touching the network
+            self._limiter.acquire()
+
             # Scrape the page
             scrape_result = self.scraper.scrape_url(url)
             
             if scrape_result['status'] != 'success':
-                return {
-                    'url': url,
-                    'status': 'failed',
-                    'emails': [],
-                    'error': scrape_result.get('error', 'Unknown error'),
-                    'source_type': 'main'
-                }
-            
+                return ScrapeResult(
+                    url=url,
+                    status='failed',
+                    error=scrape_result.get('error', 'Unknown error')
+                )
+
             # Extract emails from the content
-            emails_with_context = self.email_extractor.extract_emails_from_html(
+            emails_with_context = self._extract_emails_cached(
                 scrape_result['html'], url
             )
-            
+
             emails = [email for email, context in emails_with_context]
             
-            return {
-                'url': url,
-                'status': 'success',
-                'emails': emails,
-                'source_page': url,
-                'scraping_method': scrape_result.get('scraping_method', 'unknown'),
-                'title': scrape_result.get('title', ''),
-                'links': scrape_result.get('links', []),
-                'source_type': 'main'
-            }
-            
+            return ScrapeResult(
+                url=url,
+                status='success',
+                emails=emails,
+                source_page=url,
+                scraping_method=scrape_result.get('scraping_method', 'unknown'),
+                title=scrape_result.get('title', ''),
+                links=scrape_result.get('links', [])
+            )
+
         except Exception as e:
             logger.error(f"Error scraping {url}: {e}")
-            return {
-                'url': url,
-                'status': 'failed',
-                'emails': [],
-                'error': str(e),
-                'source_type': 'main'
-            }
+            return ScrapeResult(url=url, status='failed', error=str(e))
     
-    def _scrape_internal_pages(self, base_url: str) -> List[Dict[str, Any]]:
+    def _extract_emails_cached(self, html: str, url: str) -> List[Tuple[str, str]]:
+        """
+        Extract emails from HTML, memoizing on a hash of the content.
+
+        Internal pages of the same site frequently serve identical markup
+        (shared templates, soft-404 shells), so a content-hash hit skips
+        the full parse and regex scan. The cache is an LRU bounded at
+        _EXTRACT_CACHE_SIZE entries.
+
+        Args:
+            html (str): Page HTML
+            url (str): URL the HTML came from (passed through to the extractor)
+
+        Returns:
+            List[Tuple[str, str]]: (email, context) pairs
+        """
+        if XXHASH_AVAILABLE:
+            key = xxhash.xxh3_64_intdigest(html.encode('utf-8', 'surrogatepass'))
+        else:
+            key = hash(html)
+
+        with self._extract_cache_lock:
+            cached = self._extract_cache.get(key)
+            if cached is not None:
+                self._extract_cache.move_to_end(key)
+                return cached
+
+        emails_with_context = self.email_extractor.extract_emails_from_html(html, url)
+
+        with self._extract_cache_lock:
+            self._extract_cache[key] = emails_with_context
+            if len(self._extract_cache) > _EXTRACT_CACHE_SIZE:
+                self._extract_cache.popitem(last=False)
+
+        return emails_with_context
+
+    def _scrape_internal_pages(self, base_url: str) -> List[ScrapeResult]:
         """
         Scrape internal pages for additional emails.
-        
+
         Args:
             base_url (str): Base URL to find internal pages from
-            
+
         Returns:
-            List[Dict[str, Any]]: Results from internal pages
+            List[ScrapeResult]: Results from internal pages
         """
         results = []
         
@@ -279,17 +656,45 @@ class EmailScraper:
             # Limit the number of pages to scrape
             pages_to_scrape = relevant_pages[:self.max_internal_pages]
             
+            # Fetch first, extract later: internal pages only need the
+            # addresses (not per-node DOM context), so their HTML is
+            # batched into one joined regex pass instead of a full
+            # extractor call per page
+            fetched = []  # (page_url, scrape_result) for successful fetches
             for page_url in pages_to_scrape:
                 try:
-                    result = self._scrape_single_url(page_url)
-                    result['source_type'] = 'internal'
-                    results.append(result)
-                    
-                    time.sleep(0.5)  # Shorter delay for internal pages
-                    
+                    self._limiter.acquire()
+                    scrape_result = self.scraper.scrape_url(page_url)
                 except Exception as e:
                     logger.error(f"Error scraping internal page {page_url}: {e}")
-            
+                    continue
+                if scrape_result['status'] != 'success':
+                    results.append(ScrapeResult(
+                        url=page_url,
+                        status='failed',
+                        error=scrape_result.get('error', 'Unknown error'),
+                        source_type='internal'
+                    ))
+                    continue
+                fetched.append((page_url, scrape_result))
+
+            if fetched:
+                email_batches = self.email_extractor.extract_emails_joined(
+                    [scrape_result['html'] for _, scrape_result in fetched],
+                    base_url
+                )
+                for (page_url, scrape_result), emails in zip(fetched, email_batches):
+                    results.append(ScrapeResult(
+                        url=page_url,
+                        status='success',
+                        emails=emails,
+                        source_page=page_url,
+                        scraping_method=scrape_result.get('scraping_method', 'unknown'),
+                        title=scrape_result.get('title', ''),
+                        links=scrape_result.get('links', []),
+                        source_type='internal'
+                    ))
+
         except Exception as e:
             logger.error(f"Error getting internal pages for {base_url}: {e}")
         
@@ -305,24 +710,12 @@ class EmailScraper:
         Returns:
             List[str]: Filtered list of relevant URLs
         """
-        relevant_keywords = {
-            'contact', 'about', 'team', 'company', 'business',
-            'services', 'products', 'careers', 'jobs', 'career',
-            'staff', 'people', 'leadership', 'management'
-        }
-        
-        relevant_urls = []
-        
-        for url in urls:
-            url_lower = url.lower()
-            
-            # Check if URL contains relevant keywords
-            for keyword in relevant_keywords:
-                if keyword in url_lower:
-                    relevant_urls.append(url)
-                    break
-        
-        return relevant_urls
+        keywords = _RELEVANT_PAGE_KEYWORDS
+        split = _PATH_TOKEN_SPLIT
+        return [
+            url for url in urls
+            if keywords.intersection(split(urlsplit(url).path.lower()))
+        ]
     
     def _process_social_links(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -339,14 +732,18 @@ class EmailScraper:
         if not self.social_scraper:
             return social_results
 
-        # Collect all links from results
-        all_links = []
-        for result in results:
-            links = result.get('links', [])
-            all_links.extend(links)
-        
+        # Deduplicate while flattening — every duplicate social link
+        # would otherwise cost a profile fetch downstream. dict.fromkeys
+        # keeps first-seen order and yields a real list, which the
+        # detector's signature expects
+        unique_links = list(dict.fromkeys(
+            link
+            for result in results
+            for link in result.get('links', ())
+        ))
+
         # Detect social media links
-        social_links = self.social_scraper.detect_social_links(all_links)
+        social_links = self.social_scraper.detect_social_links(unique_links)
         
         # Scrape social media profiles
         if any(social_links.values()):
@@ -368,24 +765,30 @@ class EmailScraper:
         Returns:
             Dict[str, str]: Dictionary mapping output types to file paths
         """
+        writers = {}
+        if self.output_format in _CSV_FORMATS:
+            writers['csv'] = self.output_writer.write_results_to_csv
+        if self.output_format in _EXCEL_FORMATS:
+            writers['excel'] = self.output_writer.write_results_to_excel
+        # Always generate detailed report
+        writers['report'] = self.output_writer.write_detailed_report
+
+        # The writers are independent passes over the same results — CSV
+        # and the report are IO-bound, Excel serialization is CPU-bound —
+        # so overlapping them makes the output phase cost roughly the
+        # slowest writer instead of their sum
         output_files = {}
-        
-        try:
-            if self.output_format in ['csv', 'both']:
-                csv_file = self.output_writer.write_results_to_csv(results)
-                output_files['csv'] = csv_file
-            
-            if self.output_format in ['excel', 'both']:
-                excel_file = self.output_writer.write_results_to_excel(results)
-                output_files['excel'] = excel_file
-            
-            # Always generate detailed report
-            report_file = self.output_writer.write_detailed_report(results)
-            output_files['report'] = report_file
-            
-        except Exception as e:
-            logger.error(f"Error generating outputs: {e}")
-        
+        with ThreadPoolExecutor(max_workers=len(writers)) as pool:
+            futures = {
+                output_type: pool.submit(writer, results)
+                for output_type, writer in writers.items()
+            }
+            for output_type, future in futures.items():
+                try:
+                    output_files[output_type] = future.result()
+                except Exception as e:
+                    logger.error(f"Error generating {output_type} output: {e}")
+
         return output_files
     
     def _create_summary(self, results: List[Dict[str, Any]], 
@@ -400,32 +803,35 @@ class EmailScraper:
         Returns:
             Dict[str, Any]: Complete summary
         """
-        # Calculate statistics
+        # Shred the records into parallel columns in one pass, then let
+        # C-level primitives do the aggregation: list.count, Counter, and
+        # set.union all run without per-item interpreter dispatch
         total_urls = len(results)
-        successful_urls = len([r for r in results if r.get('status') == 'success'])
-        failed_urls = len([r for r in results if r.get('status') == 'failed'])
-        
-        all_emails = []
-        for result in results:
-            emails = result.get('emails', [])
-            all_emails.extend(emails)
-        
-        unique_emails = list(set(all_emails))
-        
-        # Count by source type
-        source_counts = {}
+        statuses = []
+        source_types = []
+        email_lists = []
         for result in results:
-            source_type = result.get('source_type', 'unknown')
-            source_counts[source_type] = source_counts.get(source_type, 0) + 1
-        
+            statuses.append(result.get('status'))
+            source_types.append(result.get('source_type', 'unknown'))
+            email_lists.append(result.get('emails', ()))
+
+        successful_urls = statuses.count('success')
+        failed_urls = statuses.count('failed')
+        source_counts = dict(Counter(source_types))
+        total_emails = sum(map(len, email_lists))
+        unique_emails = set().union(*email_lists) if email_lists else set()
+
         summary = {
             'total_urls_processed': total_urls,
             'successful_scrapes': successful_urls,
             'failed_scrapes': failed_urls,
             'success_rate': (successful_urls / total_urls * 100) if total_urls > 0 else 0,
-            'total_emails_found': len(all_emails),
+            'total_emails_found': total_emails,
             'unique_emails_found': len(unique_emails),
             'emails_by_source': source_counts,
+            # Per-URL records ride along for consumers that need rows
+            # rather than totals (the Streamlit table, the SQLite store)
+            'detailed_results': results,
             'output_files': output_files,
             'timestamp': time.time(),
             'settings': {
@@ -449,6 +855,7 @@ class EmailScraper:
             'total_emails_found': 0,
             'unique_emails_found': 0,
             'emails_by_source': {},
+            'detailed_results': [],
             'output_files': {},
             'timestamp': time.time(),
             'settings': {
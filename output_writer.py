@@ -5,13 +5,37 @@ This module handles exporting scraping results to various file formats
 including CSV and Excel with proper formatting and organization.
 """
 
+import csv
+import io
 import logging
+import os
+from collections import Counter
 try:
     import pandas as pd
     PANDAS_AVAILABLE = True
 except ImportError:
     PANDAS_AVAILABLE = False
     print("Warning: pandas not available. Using CSV-only output.")
+try:
+    import openpyxl
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
@@ -20,6 +44,10 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Column order shared by the CSV writers and the Excel results sheet
+_RESULT_COLUMNS = ['URL', 'Email', 'Source_Page', 'Status',
+                   'Scraping_Method', 'Error', 'Timestamp']
+
 
 class OutputWriter:
     """
@@ -58,15 +86,29 @@ class OutputWriter:
         filepath = self.output_dir / filename
         
         try:
-            # Convert results to DataFrame
-            df = self._prepare_dataframe(results)
-            
-            # Write to CSV
-            df.to_csv(filepath, index=False, encoding='utf-8')
-            
+            # Rows stream straight through csv.writer on a 1 MiB-buffered
+            # handle: peak memory stays at one row regardless of result
+            # count, where the previous columnar build materialized every
+            # column before handing them to a DataFrame writer, and the
+            # CSV path no longer needs polars or pandas at all
+            now = datetime.now().isoformat()
+            with open(filepath, 'w', newline='', encoding='utf-8',
+                      buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(_RESULT_COLUMNS)
+                for result in results:
+                    url = result.get('url', '')
+                    status = result.get('status', 'unknown')
+                    source_page = result.get('source_page', '')
+                    scraping_method = result.get('scraping_method', '')
+                    error = result.get('error', '')
+                    for email in result.get('emails', []) or ['']:
+                        writer.writerow([url, email, source_page, status,
+                                         scraping_method, error, now])
+
             logger.info(f"Results written to CSV: {filepath}")
             return str(filepath)
-            
+
         except Exception as e:
             logger.error(f"Error writing CSV file: {e}")
             raise
@@ -85,7 +127,16 @@ class OutputWriter:
         """
         if not PANDAS_AVAILABLE:
             raise ImportError("pandas is required for Excel output. Please install pandas.")
-            
+
+        # openpyxl holds the whole sheet XML in memory; past ~100k rows
+        # the columnar Parquet writer is the right tool
+        row_estimate = sum(max(len(r.get('emails', ())), 1) for r in results)
+        if row_estimate > 100_000:
+            logger.warning(
+                f"Excel export of ~{row_estimate} rows will be slow and "
+                f"memory-heavy; consider write_results_to_parquet for "
+                f"large result sets")
+
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"email_scraping_results_{timestamp}.xlsx"
@@ -121,21 +172,69 @@ class OutputWriter:
             logger.error(f"Error writing Excel file: {e}")
             raise
     
-    def _prepare_dataframe(self, results: List[Dict[str, Any]]) -> pd.DataFrame:
+    def write_results_to_parquet(self, results: List[Dict[str, Any]],
+                                 filename: str = None) -> str:
         """
-        Prepare a DataFrame from scraping results.
-        
+        Write scraping results to a Parquet file.
+
+        The columnar zstd-compressed format writes and reloads many times
+        faster than xlsx and produces far smaller files, making it the
+        preferred archival output for large result sets.
+
         Args:
             results (List[Dict[str, Any]]): List of scraping results
-            
+            filename (str): Output filename (optional)
+
         Returns:
-            pd.DataFrame: Formatted DataFrame
+            str: Path to the created Parquet file
         """
-        if not results:
-            return pd.DataFrame()
-        
-        # Extract and flatten the data
-        rows = []
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"email_scraping_results_{timestamp}.parquet"
+
+        filepath = self.output_dir / filename
+
+        try:
+            if POLARS_AVAILABLE:
+                pl.DataFrame(self._prepare_columns(results)).write_parquet(
+                    filepath, compression='zstd')
+            elif PANDAS_AVAILABLE:
+                self._prepare_dataframe(results).to_parquet(
+                    filepath, engine='pyarrow', compression='zstd')
+            else:
+                raise ImportError(
+                    "polars or pandas is required for Parquet output.")
+
+            logger.info(f"Results written to Parquet: {filepath}")
+            return str(filepath)
+
+        except Exception as e:
+            logger.error(f"Error writing Parquet file: {e}")
+            raise
+
+    def _prepare_columns(self, results: List[Dict[str, Any]]) -> Dict[str, List]:
+        """
+        Flatten results into parallel column lists, one row per email.
+
+        Args:
+            results (List[Dict[str, Any]]): List of scraping results
+
+        Returns:
+            Dict[str, List]: Column name -> list of values, in output order
+        """
+        urls: List[str] = []
+        email_col: List[str] = []
+        source_pages: List[str] = []
+        statuses: List[str] = []
+        methods: List[str] = []
+        errors: List[str] = []
+        timestamps: List[str] = []
+
+        # One timestamp for the whole export: every row shares the export
+        # moment semantically, and hoisting the call out of the loop saves
+        # a clock read plus an ISO format per row
+        now = datetime.now().isoformat()
+
         for result in results:
             url = result.get('url', '')
             status = result.get('status', 'unknown')
@@ -143,44 +242,44 @@ class OutputWriter:
             source_page = result.get('source_page', '')
             scraping_method = result.get('scraping_method', '')
             error = result.get('error', '')
-            
-            if emails:
-                # Create a row for each email found
-                for email in emails:
-                    rows.append({
-                        'URL': url,
-                        'Email': email,
-                        'Source_Page': source_page,
-                        'Status': status,
-                        'Scraping_Method': scraping_method,
-                        'Error': error,
-                        'Timestamp': datetime.now().isoformat()
-                    })
-            else:
-                # Create a row even if no emails found
-                rows.append({
-                    'URL': url,
-                    'Email': '',
-                    'Source_Page': source_page,
-                    'Status': status,
-                    'Scraping_Method': scraping_method,
-                    'Error': error,
-                    'Timestamp': datetime.now().isoformat()
-                })
-        
-        df = pd.DataFrame(rows)
-        
-        # Reorder columns for better readability
-        column_order = [
-            'URL', 'Email', 'Source_Page', 'Status', 
-            'Scraping_Method', 'Error', 'Timestamp'
-        ]
-        
-        # Only include columns that exist
-        existing_columns = [col for col in column_order if col in df.columns]
-        df = df[existing_columns]
+
+            for email in emails or ['']:
+                urls.append(url)
+                email_col.append(email)
+                source_pages.append(source_page)
+                statuses.append(status)
+                methods.append(scraping_method)
+                errors.append(error)
+                timestamps.append(now)
+
+        return {
+            'URL': urls,
+            'Email': email_col,
+            'Source_Page': source_pages,
+            'Status': statuses,
+            'Scraping_Method': methods,
+            'Error': errors,
+            'Timestamp': timestamps,
+        }
+
+    def _prepare_dataframe(self, results: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Prepare a DataFrame from scraping results.
         
-        return df
+        Args:
+            results (List[Dict[str, Any]]): List of scraping results
+            
+        Returns:
+            pd.DataFrame: Formatted DataFrame
+        """
+        if not results:
+            return pd.DataFrame()
+
+        # Struct-of-arrays construction: the column dict goes straight
+        # into the DataFrame without the per-row dict allocation and key
+        # reflection that a list-of-dicts build pays, and the dict order
+        # already fixes the column order
+        return pd.DataFrame(self._prepare_columns(results))
     
     def _create_summary_dataframe(self, results: List[Dict[str, Any]]) -> pd.DataFrame:
         """
@@ -192,66 +291,59 @@ class OutputWriter:
         Returns:
             pd.DataFrame: Summary DataFrame
         """
+        # One fused pass over the results: status counters, the total
+        # email count, the unique-email set, and the per-domain Counter
+        # all advance together, with no intermediate flat email list
         total_urls = len(results)
-        successful_urls = len([r for r in results if r.get('status') == 'success'])
-        failed_urls = len([r for r in results if r.get('status') == 'failed'])
-        
-        all_emails = []
+        successful_urls = 0
+        failed_urls = 0
+        total_emails = 0
+        unique_emails = set()
+        email_domains = Counter()
+
         for result in results:
-            emails = result.get('emails', [])
-            all_emails.extend(emails)
-        
-        unique_emails = list(set(all_emails))
-        
-        # Count emails by domain
-        email_domains = {}
-        for email in unique_emails:
-            if '@' in email:
-                domain = email.split('@')[1]
-                email_domains[domain] = email_domains.get(domain, 0) + 1
-        
-        # Create summary data
-        summary_data = {
-            'Metric': [
-                'Total URLs Processed',
-                'Successful Scrapes',
-                'Failed Scrapes',
-                'Total Emails Found',
-                'Unique Emails Found',
-                'Success Rate (%)',
-                'Average Emails per URL'
-            ],
-            'Value': [
-                total_urls,
-                successful_urls,
-                failed_urls,
-                len(all_emails),
-                len(unique_emails),
-                round((successful_urls / total_urls * 100) if total_urls > 0 else 0, 2),
-                round(len(all_emails) / total_urls, 2) if total_urls > 0 else 0
-            ]
-        }
-        
-        summary_df = pd.DataFrame(summary_data)
-        
-        # Add top email domains
+            status = result.get('status')
+            successful_urls += status == 'success'
+            failed_urls += status == 'failed'
+            for email in result.get('emails', ()):
+                total_emails += 1
+                if email not in unique_emails:
+                    unique_emails.add(email)
+                    # rpartition scans once from the right and hands back
+                    # the domain without a split-list allocation
+                    _, at, domain = email.rpartition('@')
+                    if at:
+                        email_domains[domain] += 1
+
+        metrics = [
+            'Total URLs Processed',
+            'Successful Scrapes',
+            'Failed Scrapes',
+            'Total Emails Found',
+            'Unique Emails Found',
+            'Success Rate (%)',
+            'Average Emails per URL'
+        ]
+        values: List[Any] = [
+            total_urls,
+            successful_urls,
+            failed_urls,
+            total_emails,
+            len(unique_emails),
+            round((successful_urls / total_urls * 100) if total_urls > 0 else 0, 2),
+            round(total_emails / total_urls, 2) if total_urls > 0 else 0
+        ]
+
+        # Append the top domains; most_common keeps a heap of 10 instead
+        # of sorting the whole domain tally
         if email_domains:
-            top_domains = sorted(email_domains.items(), key=lambda x: x[1], reverse=True)[:10]
-            domain_data = {
-                'Email Domain': [domain for domain, count in top_domains],
-                'Count': [count for domain, count in top_domains]
-            }
-            domain_df = pd.DataFrame(domain_data)
-            
-            # Combine summary and domain data
-            combined_data = {
-                'Metric': summary_data['Metric'] + [''] + ['Top Email Domains:'] + [''] * (len(top_domains) - 1),
-                'Value': summary_data['Value'] + [''] + [''] + [''] * (len(top_domains) - 1)
-            }
-            
-            summary_df = pd.DataFrame(combined_data)
-        
-        return summary_df
+            metrics.extend(['', 'Top Email Domains:'])
+            values.extend(['', ''])
+            for domain, count in email_domains.most_common(10):
+                metrics.append(domain)
+                values.append(count)
+
+        return pd.DataFrame({'Metric': metrics, 'Value': values})
     
     def _prepare_social_dataframe(self, social_results: List[Dict[str, Any]]) -> pd.DataFrame:
         """
@@ -263,34 +355,36 @@ class OutputWriter:
         Returns:
             pd.DataFrame: Social media results DataFrame
         """
-        rows = []
-        
+        platforms: List[str] = []
+        profile_urls: List[str] = []
+        titles: List[str] = []
+        email_col: List[str] = []
+        contact_infos: List[str] = []
+
         for result in social_results:
             platform = result.get('platform', '')
             url = result.get('url', '')
             title = result.get('title', '')
             emails = result.get('emails', [])
             contact_info = result.get('contact_info', {})
-            
-            if emails:
-                for email in emails:
-                    rows.append({
-                        'Platform': platform,
-                        'Profile_URL': url,
-                        'Profile_Title': title,
-                        'Email': email,
-                        'Contact_Info': str(contact_info) if contact_info else ''
-                    })
-            else:
-                rows.append({
-                    'Platform': platform,
-                    'Profile_URL': url,
-                    'Profile_Title': title,
-                    'Email': '',
-                    'Contact_Info': str(contact_info) if contact_info else ''
-                })
-        
-        return pd.DataFrame(rows)
+            # JSON rather than dict-repr: round-trippable downstream and
+            # serialized once per result, not once per email row
+            contact_str = _dumps(contact_info) if contact_info else ''
+
+            for email in emails or ['']:
+                platforms.append(platform)
+                profile_urls.append(url)
+                titles.append(title)
+                email_col.append(email)
+                contact_infos.append(contact_str)
+
+        return pd.DataFrame({
+            'Platform': platforms,
+            'Profile_URL': profile_urls,
+            'Profile_Title': titles,
+            'Email': email_col,
+            'Contact_Info': contact_infos,
+        })
     
     def _prepare_failed_dataframe(self, failed_results: List[Dict[str, Any]]) -> pd.DataFrame:
         """
@@ -302,17 +396,14 @@ class OutputWriter:
         Returns:
             pd.DataFrame: Failed results DataFrame
         """
-        rows = []
-        
-        for result in failed_results:
-            rows.append({
-                'URL': result.get('url', ''),
-                'Error': result.get('error', ''),
-                'Scraping_Method': result.get('scraping_method', ''),
-                'Timestamp': datetime.now().isoformat()
-            })
-        
-        return pd.DataFrame(rows)
+        now = datetime.now().isoformat()
+        return pd.DataFrame({
+            'URL': [result.get('url', '') for result in failed_results],
+            'Error': [result.get('error', '') for result in failed_results],
+            'Scraping_Method': [result.get('scraping_method', '')
+                                for result in failed_results],
+            'Timestamp': [now] * len(failed_results),
+        })
     
     def write_detailed_report(self, results: List[Dict[str, Any]], 
                             filename: str = None) -> str:
@@ -333,61 +424,79 @@ class OutputWriter:
         filepath = self.output_dir / filename
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            # Single streaming pass: the per-URL section is rendered into
+            # an in-memory buffer while the same traversal accumulates the
+            # counters the summary needs, so the results are walked once
+            # and no flat copy of every email is ever materialized
+            successful_urls = 0
+            failed_urls = 0
+            total_email_count = 0
+            unique_emails = set()
+            detail_buf = io.StringIO()
+
+            # Each URL becomes one block string and blocks are flushed to
+            # the buffer in batches, so the write-call count scales with
+            # the batch count rather than the line count
+            parts = []
+            for i, result in enumerate(results, 1):
+                status = result.get('status', 'N/A')
+                successful_urls += status == 'success'
+                failed_urls += status == 'failed'
+
+                block = (f"\n{i}. {result.get('url', 'N/A')}\n"
+                         f"   Status: {status}\n"
+                         f"   Method: {result.get('scraping_method', 'N/A')}\n")
+
+                emails = result.get('emails', [])
+                if emails:
+                    total_email_count += len(emails)
+                    unique_emails.update(emails)
+                    block += f"   Emails found: {len(emails)}\n"
+                    block += ''.join(f"     - {email}\n" for email in emails)
+                else:
+                    block += "   No emails found\n"
+
+                error = result.get('error')
+                if error:
+                    block += f"   Error: {error}\n"
+
+                parts.append(block)
+                if len(parts) >= 1000:
+                    detail_buf.write(''.join(parts))
+                    parts.clear()
+            if parts:
+                detail_buf.write(''.join(parts))
+
+            total_urls = len(results)
+            # A 1 MiB buffer coalesces the many small report writes into
+            # block-sized syscalls instead of one per line
+            with open(filepath, 'w', encoding='utf-8',
+                      buffering=1 << 20) as f:
                 f.write("EMAIL SCRAPING DETAILED REPORT\n")
                 f.write("=" * 50 + "\n\n")
-                
-                # Summary statistics
-                total_urls = len(results)
-                successful_urls = len([r for r in results if r.get('status') == 'success'])
-                failed_urls = len([r for r in results if r.get('status') == 'failed'])
-                
+
                 f.write(f"SUMMARY STATISTICS:\n")
                 f.write(f"Total URLs processed: {total_urls}\n")
                 f.write(f"Successful scrapes: {successful_urls}\n")
                 f.write(f"Failed scrapes: {failed_urls}\n")
                 f.write(f"Success rate: {(successful_urls/total_urls*100):.2f}%\n\n")
-                
-                # Email statistics
-                all_emails = []
-                for result in results:
-                    emails = result.get('emails', [])
-                    all_emails.extend(emails)
-                
-                unique_emails = list(set(all_emails))
-                
+
                 f.write(f"EMAIL STATISTICS:\n")
-                f.write(f"Total emails found: {len(all_emails)}\n")
+                f.write(f"Total emails found: {total_email_count}\n")
                 f.write(f"Unique emails: {len(unique_emails)}\n")
-                f.write(f"Average emails per URL: {len(all_emails)/total_urls:.2f}\n\n")
-                
-                # Results by URL
+                f.write(f"Average emails per URL: {total_email_count/total_urls:.2f}\n\n")
+
                 f.write("DETAILED RESULTS BY URL:\n")
                 f.write("-" * 30 + "\n")
-                
-                for i, result in enumerate(results, 1):
-                    f.write(f"\n{i}. {result.get('url', 'N/A')}\n")
-                    f.write(f"   Status: {result.get('status', 'N/A')}\n")
-                    f.write(f"   Method: {result.get('scraping_method', 'N/A')}\n")
-                    
-                    emails = result.get('emails', [])
-                    if emails:
-                        f.write(f"   Emails found: {len(emails)}\n")
-                        for email in emails:
-                            f.write(f"     - {email}\n")
-                    else:
-                        f.write("   No emails found\n")
-                    
-                    error = result.get('error')
-                    if error:
-                        f.write(f"   Error: {error}\n")
-                
-                # Unique emails list
+                f.write(detail_buf.getvalue())
+
+                # Unique emails list; sorted() takes the set directly and
+                # one joined write replaces a call per address
                 f.write(f"\n\nUNIQUE EMAILS FOUND:\n")
                 f.write("-" * 20 + "\n")
-                for email in sorted(unique_emails):
-                    f.write(f"{email}\n")
-            
+                if unique_emails:
+                    f.write('\n'.join(sorted(unique_emails)) + '\n')
+
             logger.info(f"Detailed report written: {filepath}")
             return str(filepath)
             
@@ -395,6 +504,18 @@ class OutputWriter:
             logger.error(f"Error writing detailed report: {e}")
             raise
     
+    def open_sink(self, output_format: str = 'excel') -> "OutputSink":
+        """
+        Open an incremental OutputSink in this writer's output directory.
+
+        Args:
+            output_format (str): 'csv', 'excel' or 'both'
+
+        Returns:
+            OutputSink: Sink accepting one result per write() call
+        """
+        return OutputSink(self.output_dir, output_format)
+
     def get_output_files(self) -> List[str]:
         """
         Get list of all output files in the output directory.
@@ -402,15 +523,133 @@ class OutputWriter:
         Returns:
             List[str]: List of output file paths
         """
-        files = []
-        for file_path in self.output_dir.glob("*"):
-            if file_path.is_file():
-                files.append(str(file_path))
-        
-        return sorted(files)
+        # os.scandir surfaces the file type from the directory listing
+        # itself, so entry.is_file() avoids a stat() call per entry
+        with os.scandir(self.output_dir) as entries:
+            return sorted(
+                os.path.join(self.output_dir, entry.name)
+                for entry in entries if entry.is_file()
+            )
+
+
+class OutputSink:
+    """
+    Incremental result writer.
+
+    Appends each scraping result to the output files as it completes,
+    so writing overlaps the network waits of the scrape and per-record
+    memory is released immediately instead of buffering every record
+    for one big serialization pass at the end. CSV rows go through a
+    1 MiB-buffered csv.writer; Excel rows stream into an openpyxl
+    write-only workbook. Summary statistics are kept as running
+    counters and emitted as a sheet on close().
+    """
+
+    _COLUMNS = _RESULT_COLUMNS
+
+    def __init__(self, output_dir: Path, output_format: str = 'excel'):
+        """
+        Open the sink's output files.
+
+        Args:
+            output_dir (Path): Directory to write into
+            output_format (str): 'csv', 'excel' or 'both'
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._csv_file = None
+        self._csv_writer = None
+        self._workbook = None
+        self._paths: Dict[str, str] = {}
+
+        if output_format in ('csv', 'both'):
+            csv_path = output_dir / f"email_scraping_results_{timestamp}.csv"
+            self._csv_file = open(csv_path, 'w', newline='',
+                                  encoding='utf-8', buffering=1 << 20)
+            self._csv_writer = csv.writer(self._csv_file)
+            self._csv_writer.writerow(self._COLUMNS)
+            self._paths['csv'] = str(csv_path)
+
+        if output_format in ('excel', 'both'):
+            if not OPENPYXL_AVAILABLE:
+                raise ImportError(
+                    "openpyxl is required for Excel output. Please install openpyxl.")
+            self._excel_path = output_dir / f"email_scraping_results_{timestamp}.xlsx"
+            self._workbook = openpyxl.Workbook(write_only=True)
+            self._results_sheet = self._workbook.create_sheet('Email_Results')
+            self._results_sheet.append(self._COLUMNS)
+            self._paths['excel'] = str(self._excel_path)
+
+        # Running statistics for the summary sheet
+        self._total = 0
+        self._successful = 0
+        self._failed = 0
+        self._total_emails = 0
+        self._unique_emails = set()
+
+    def write(self, result: Dict[str, Any]) -> None:
+        """Append one scraping result to the open output files."""
+        url = result.get('url', '')
+        status = result.get('status', 'unknown')
+        emails = result.get('emails', [])
+        source_page = result.get('source_page', '')
+        scraping_method = result.get('scraping_method', '')
+        error = result.get('error', '')
+        now = datetime.now().isoformat()
+
+        self._total += 1
+        self._successful += status == 'success'
+        self._failed += status == 'failed'
+        self._total_emails += len(emails)
+        self._unique_emails.update(emails)
+
+        for email in emails or ['']:
+            row = [url, email, source_page, status, scraping_method, error, now]
+            if self._csv_writer is not None:
+                self._csv_writer.writerow(row)
+            if self._workbook is not None:
+                self._results_sheet.append(row)
+
+    def close(self) -> Dict[str, str]:
+        """Finalize the output files and return their paths by type."""
+        if self._csv_file is not None:
+            self._csv_file.close()
+            logger.info(f"Results written to CSV: {self._paths['csv']}")
+        if self._workbook is not None:
+            summary_sheet = self._workbook.create_sheet('Summary')
+            summary_sheet.append(['Metric', 'Value'])
+            success_rate = round(
+                (self._successful / self._total * 100) if self._total else 0, 2)
+            avg_emails = round(
+                self._total_emails / self._total, 2) if self._total else 0
+            for metric, value in [
+                    ('Total URLs Processed', self._total),
+                    ('Successful Scrapes', self._successful),
+                    ('Failed Scrapes', self._failed),
+                    ('Total Emails Found', self._total_emails),
+                    ('Unique Emails Found', len(self._unique_emails)),
+                    ('Success Rate (%)', success_rate),
+                    ('Average Emails per URL', avg_emails)]:
+                summary_sheet.append([metric, value])
+            self._workbook.save(self._excel_path)
+            logger.info(f"Results written to Excel: {self._paths['excel']}")
+        return dict(self._paths)
 
 
 # Convenience functions for quick output writing
+
+# Shared writer for the convenience functions: constructing OutputWriter
+# per call re-created the output directory and its Path objects each time
+_default_writer: Optional[OutputWriter] = None
+
+
+def _get_default_writer() -> OutputWriter:
+    """Return the lazily created module-wide OutputWriter."""
+    global _default_writer
+    if _default_writer is None:
+        _default_writer = OutputWriter()
+    return _default_writer
+
+
 def write_to_csv(results: List[Dict[str, Any]], filename: str = None) -> str:
     """
     Convenience function to write results to CSV.
@@ -422,8 +661,7 @@ def write_to_csv(results: List[Dict[str, Any]], filename: str = None) -> str:
     Returns:
         str: Path to the created CSV file
     """
-    writer = OutputWriter()
-    return writer.write_results_to_csv(results, filename)
+    return _get_default_writer().write_results_to_csv(results, filename)
 
 
 def write_to_excel(results: List[Dict[str, Any]], filename: str = None) -> str:
@@ -437,8 +675,7 @@ def write_to_excel(results: List[Dict[str, Any]], filename: str = None) -> str:
     Returns:
         str: Path to the created Excel file
     """
-    writer = OutputWriter()
-    return writer.write_results_to_excel(results, filename) 
+    return _get_default_writer().write_results_to_excel(results, filename)
 
 import pandas as pd
 
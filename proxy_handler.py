@@ -5,19 +5,64 @@ This module handles proxy rotation and management for web scraping.
 Provides functionality to use custom proxy lists or fetch free proxies.
 """
 
+import asyncio
+import functools
+import itertools
 import logging
+import os
 import random
+import tempfile
+import threading
 import time
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional, Tuple
 from urllib.parse import urlparse
 import json
 from bs4 import BeautifulSoup, Tag
+try:
+    import lxml  # noqa: F401 - probe for BeautifulSoup's C parser
+    _BS_PARSER = 'lxml'
+except ImportError:
+    _BS_PARSER = 'html.parser'
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Validated proxies persisted to disk stay trusted this long, so process
+# restarts within the window skip re-fetching and re-validating
+_CACHE_MAX_AGE_S = 3600
+
+# A proxy failing this many times in a row is ejected from the pool
+_MAX_CONSECUTIVE_FAILS = 3
+
+
+class _ProxyStat:
+    """
+    Per-proxy performance record.
+
+    Slots instead of a 5-key dict per proxy: fixed attribute offsets
+    make each record several times smaller and stat updates in the
+    test/record hot paths cheaper than repeated string-key hashing.
+    """
+
+    __slots__ = ('success_count', 'fail_count', 'consecutive_fails',
+                 'last_used', 'avg_response_time')
+
+    def __init__(self):
+        self.success_count = 0
+        self.fail_count = 0
+        self.consecutive_fails = 0
+        self.last_used = None
+        self.avg_response_time = 0.0
+
+    def as_dict(self) -> Dict:
+        """Dict view for external consumers of get_proxy_stats."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 class ProxyHandler:
     """
@@ -27,30 +72,66 @@ class ProxyHandler:
     fetch free proxies from various sources, and rotate through them.
     """
     
-    def __init__(self, proxy_list: Optional[List[str]] = None, 
+    def __init__(self, proxy_list: Optional[List[str]] = None,
                  proxy_file: Optional[str] = None,
-                 use_free_proxies: bool = False):
+                 use_free_proxies: bool = False,
+                 validate_on_start: bool = False,
+                 cache_file: Optional[str] = None):
         """
         Initialize the ProxyHandler.
-        
+
         Args:
             proxy_list (List[str]): List of proxy URLs in format 'http://ip:port'
             proxy_file (str): Path to file containing proxy list
             use_free_proxies (bool): Whether to fetch free proxies
+            validate_on_start (bool): Test proxies up front and keep only the
+                working subset, instead of paying for dead IPs per request
+            cache_file (str): Where to persist the validated pool between runs
         """
         self.proxies = []
-        self.current_index = 0
+        # Round-robin iterator over the pool; rebuilt lazily after any
+        # pool mutation so next() stays a plain O(1) call with no
+        # index/modulo bookkeeping
+        self._round_robin = None
         self.proxy_stats = {}  # Track proxy performance
-        
+        # proxy -> position in self.proxies, for O(1) membership checks
+        # and swap-pop removal
+        self._proxy_index = {}
+        # Serializes stat updates once proxies are tested across threads
+        self._stats_lock = threading.Lock()
+        # Cached best-performance pick, recomputed lazily when stats
+        # or the pool change instead of re-sorting on every request
+        self._best_proxy: Optional[str] = None
+        self._stats_dirty = True
+
+        # One session for all proxy tests: reuses the SSL context and
+        # pools connections to the test endpoint, and is sized for the
+        # concurrent testing in test_all_proxies (Session is thread-safe
+        # for concurrent requests through different proxies)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self.cache_file = cache_file or os.path.join(
+            tempfile.gettempdir(), 'email_scraper_proxy_cache.json'
+        )
+
         # Load proxies from different sources
         if proxy_list is not None:
             self.add_proxies(proxy_list)
-        
+
         if proxy_file is not None:
             self.load_proxies_from_file(proxy_file)
-        
+
         if use_free_proxies:
-            self.fetch_free_proxies()
+            # A recent validated pool on disk beats re-fetching free lists,
+            # which are slow and ~30% dead on arrival
+            if not self._load_cached_proxies():
+                self.fetch_free_proxies()
+                if validate_on_start:
+                    self.validate_pool()
+        elif validate_on_start and self.proxies:
+            self.validate_pool()
     
     def add_proxies(self, proxy_list: List[str]):
         """
@@ -60,15 +141,13 @@ class ProxyHandler:
             proxy_list (List[str]): List of proxy URLs
         """
         for proxy in proxy_list:
-            if self._validate_proxy_format(proxy):
+            if proxy not in self._proxy_index and self._validate_proxy_format(proxy):
+                self._proxy_index[proxy] = len(self.proxies)
                 self.proxies.append(proxy)
-                self.proxy_stats[proxy] = {
-                    'success_count': 0,
-                    'fail_count': 0,
-                    'last_used': None,
-                    'avg_response_time': 0
-                }
+                self.proxy_stats[proxy] = _ProxyStat()
         
+        self._round_robin = None
+        self._stats_dirty = True
         logger.info(f"Added {len(proxy_list)} proxies")
     
     def load_proxies_from_file(self, file_path: str):
@@ -102,91 +181,127 @@ class ProxyHandler:
             max_proxies (int): Maximum number of proxies to fetch
         """
         logger.info("Fetching free proxies...")
-        
-        # Multiple sources for free proxies
-        sources = [
-            self._fetch_from_proxylist_download,
-            self._fetch_from_free_proxy_list,
-            self._fetch_from_geonode
-        ]
-        
-        for source_func in sources:
-            try:
-                proxies = source_func()
-                if proxies:
-                    self.add_proxies(proxies[:max_proxies])
-                    if len(self.proxies) >= max_proxies:
-                        break
-            except Exception as e:
-                logger.warning(f"Failed to fetch from {source_func.__name__}: {e}")
-        
+
+        try:
+            # The three sources are independent HTTP round trips, so
+            # firing them concurrently costs max(RTT) instead of sum(RTT)
+            source_results = asyncio.run(self._fetch_free_proxies_async())
+        except RuntimeError:
+            # Already inside a running event loop: fall back to the
+            # serial synchronous fetchers
+            source_results = []
+            for source_func in (self._fetch_from_proxylist_download,
+                                self._fetch_from_free_proxy_list,
+                                self._fetch_from_geonode):
+                try:
+                    source_results.append(source_func())
+                except Exception as e:
+                    logger.warning(f"Failed to fetch from {source_func.__name__}: {e}")
+
+        for proxies in source_results:
+            if proxies:
+                self.add_proxies(proxies[:max_proxies])
+                if len(self.proxies) >= max_proxies:
+                    break
+
         logger.info(f"Fetched {len(self.proxies)} free proxies")
+
+    async def _fetch_free_proxies_async(self) -> List[List[str]]:
+        """
+        Fetch all free-proxy sources concurrently over one async client.
+
+        Returns:
+            List[List[str]]: One proxy list per source (empty on failure)
+        """
+        async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
+
+            async def fetch(url: str, parse):
+                try:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    return parse(response)
+                except Exception as e:
+                    logger.warning(f"Failed to fetch proxies from {url}: {e}")
+                    return []
+
+            return list(await asyncio.gather(
+                fetch("https://www.proxy-list.download/api/v1/get?type=http",
+                      lambda r: self._parse_proxylist_download(r.text)),
+                fetch("https://free-proxy-list.net/",
+                      lambda r: self._parse_free_proxy_list(r.content)),
+                fetch("https://proxylist.geonode.com/api/proxy-list?limit=100"
+                      "&page=1&sort_by=lastChecked&sort_type=desc"
+                      "&protocols=http%2Chttps",
+                      lambda r: self._parse_geonode(r.json())),
+            ))
     
+    @staticmethod
+    def _parse_proxylist_download(text: str) -> List[str]:
+        """Parse the proxylist.download plain-text response."""
+        return [f"http://{line}" for line in text.strip().split('\n') if line]
+
+    @staticmethod
+    def _parse_free_proxy_list(content: bytes) -> List[str]:
+        """Parse the free-proxy-list.net HTML table."""
+        # lxml's C parser is roughly an order of magnitude faster than
+        # the pure-Python html.parser on a page this size
+        soup = BeautifulSoup(content, _BS_PARSER)
+        proxies = []
+        table = soup.find('table', class_='table')
+        if table and isinstance(table, Tag):
+            rows = table.find_all('tr')[1:]
+            for row in rows:
+                if isinstance(row, Tag):
+                    cols = row.find_all('td')
+                    if len(cols) >= 8:
+                        ip = cols[0].text.strip()
+                        port = cols[1].text.strip()
+                        https = cols[6].text.strip()
+                        if https == 'yes':
+                            proxies.append(f"https://{ip}:{port}")
+        return proxies
+
+    @staticmethod
+    def _parse_geonode(data: Dict) -> List[str]:
+        """Parse the geonode proxy-list JSON payload."""
+        proxies = []
+        for proxy in data.get('data', []):
+            ip = proxy.get('ip')
+            port = proxy.get('port')
+            protocol = proxy.get('protocol', 'http')
+            if ip and port:
+                proxies.append(f"{protocol}://{ip}:{port}")
+        return proxies
+
     def _fetch_from_proxylist_download(self) -> List[str]:
         """Fetch proxies from proxylist.download."""
         try:
             url = "https://www.proxy-list.download/api/v1/get?type=http"
             response = requests.get(url, timeout=10)
             response.raise_for_status()
-            
-            proxies = []
-            for line in response.text.strip().split('\n'):
-                if line:
-                    proxies.append(f"http://{line}")
-            
-            return proxies
-            
+            return self._parse_proxylist_download(response.text)
         except Exception as e:
             logger.error(f"Error fetching from proxylist.download: {e}")
             return []
-    
+
     def _fetch_from_free_proxy_list(self) -> List[str]:
         """Fetch proxies from free-proxy-list.net."""
         try:
             url = "https://free-proxy-list.net/"
             response = requests.get(url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            if not isinstance(soup, BeautifulSoup):
-                soup = BeautifulSoup(str(soup), 'html.parser')
-            proxies = []
-            table = soup.find('table', class_='table')
-            if table and isinstance(table, Tag):
-                rows = table.find_all('tr')[1:]
-                for row in rows:
-                    if isinstance(row, Tag):
-                        cols = row.find_all('td')
-                        if len(cols) >= 8:
-                            ip = cols[0].text.strip()
-                            port = cols[1].text.strip()
-                            https = cols[6].text.strip()
-                            if https == 'yes':
-                                proxies.append(f"https://{ip}:{port}")
-            return proxies
+            return self._parse_free_proxy_list(response.content)
         except Exception as e:
             logger.error(f"Error fetching from free-proxy-list.net: {e}")
             return []
-    
+
     def _fetch_from_geonode(self) -> List[str]:
         """Fetch proxies from geonode.com."""
         try:
             url = "https://proxylist.geonode.com/api/proxy-list?limit=100&page=1&sort_by=lastChecked&sort_type=desc&protocols=http%2Chttps"
             response = requests.get(url, timeout=10)
             response.raise_for_status()
-            
-            data = response.json()
-            proxies = []
-            
-            for proxy in data.get('data', []):
-                ip = proxy.get('ip')
-                port = proxy.get('port')
-                protocol = proxy.get('protocol', 'http')
-                
-                if ip and port:
-                    proxies.append(f"{protocol}://{ip}:{port}")
-            
-            return proxies
-            
+            return self._parse_geonode(response.json())
         except Exception as e:
             logger.error(f"Error fetching from geonode: {e}")
             return []
@@ -205,24 +320,28 @@ class ProxyHandler:
             return None
         
         if strategy == 'round_robin':
-            proxy = self.proxies[self.current_index]
-            self.current_index = (self.current_index + 1) % len(self.proxies)
-            return proxy
+            if self._round_robin is None:
+                self._round_robin = itertools.cycle(self.proxies)
+            return next(self._round_robin)
         
         elif strategy == 'random':
             return random.choice(self.proxies)
         
         elif strategy == 'best_performance':
-            # Sort by success rate and response time
-            sorted_proxies = sorted(
-                self.proxies,
-                key=lambda p: (
-                    self.proxy_stats[p]['success_count'] - self.proxy_stats[p]['fail_count'],
-                    -self.proxy_stats[p]['avg_response_time']
-                ),
-                reverse=True
-            )
-            return sorted_proxies[0] if sorted_proxies else None
+            # One O(N) min() when stats changed, O(1) otherwise — the
+            # old code re-sorted the whole pool on every call just to
+            # read its first element
+            if self._stats_dirty or self._best_proxy not in self.proxy_stats:
+                stats = self.proxy_stats
+                self._best_proxy = min(
+                    self.proxies,
+                    key=lambda p: (
+                        stats[p].fail_count - stats[p].success_count,
+                        stats[p].avg_response_time
+                    )
+                )
+                self._stats_dirty = False
+            return self._best_proxy
         
         else:
             return self.proxies[0]
@@ -242,62 +361,198 @@ class ProxyHandler:
         try:
             proxies = {'http': proxy, 'https': proxy}
             start_time = time.time()
-            response = requests.get(test_url, proxies=proxies, timeout=timeout)
+            response = self._session.get(test_url, proxies=proxies, timeout=timeout)
             response_time = time.time() - start_time
             if response.status_code == 200:
-                self.proxy_stats[proxy]['success_count'] += 1
-                self.proxy_stats[proxy]['last_used'] = time.time()
-                current_avg = self.proxy_stats[proxy]['avg_response_time']
-                success_count = self.proxy_stats[proxy]['success_count']
-                self.proxy_stats[proxy]['avg_response_time'] = (
-                    (current_avg * (success_count - 1) + response_time) / success_count
-                )
+                with self._stats_lock:
+                    stats = self.proxy_stats[proxy]
+                    stats.success_count += 1
+                    stats.consecutive_fails = 0
+                    stats.last_used = time.time()
+                    stats.avg_response_time = (
+                        (stats.avg_response_time * (stats.success_count - 1)
+                         + response_time) / stats.success_count
+                    )
+                    self._stats_dirty = True
                 logger.debug(f"Proxy {proxy} test successful (response time: {response_time:.2f}s)")
                 return True
             else:
-                self.proxy_stats[proxy]['fail_count'] += 1
+                with self._stats_lock:
+                    self.proxy_stats[proxy].fail_count += 1
+                    self._stats_dirty = True
                 return False
         except Exception as e:
-            self.proxy_stats[proxy]['fail_count'] += 1
+            with self._stats_lock:
+                self.proxy_stats[proxy].fail_count += 1
+                self._stats_dirty = True
             logger.debug(f"Proxy {proxy} test failed: {e}")
             return False
     
-    def test_all_proxies(self, test_url: str = "http://httpbin.org/ip") -> List[str]:
+    def test_all_proxies(self, test_url: str = "http://httpbin.org/ip",
+                         max_workers: int = 32) -> List[str]:
         """
-        Test all proxies and return working ones.
-        
+        Test all proxies concurrently and return working ones.
+
+        Each test is almost pure socket wait, so overlapping them across
+        threads collapses minutes of serial timeouts into roughly one
+        timeout's worth of wall clock.
+
         Args:
             test_url (str): URL to test against
-            
+            max_workers (int): Concurrent test threads
+
         Returns:
             List[str]: List of working proxy URLs
         """
         working_proxies = []
-        
-        for proxy in self.proxies:
-            if self.test_proxy(proxy, test_url):
-                working_proxies.append(proxy)
-        
+
+        if self.proxies:
+            workers = min(max_workers, len(self.proxies))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(self.test_proxy, proxy, test_url): proxy
+                    for proxy in self.proxies
+                }
+                for future in as_completed(futures):
+                    if future.result():
+                        working_proxies.append(futures[future])
+
         logger.info(f"Found {len(working_proxies)} working proxies out of {len(self.proxies)}")
         return working_proxies
-    
+
+    def validate_pool(self, test_url: str = "http://httpbin.org/ip"):
+        """
+        Shrink the pool to its working subset and persist it to disk.
+
+        Paying validation once up front amortizes across every request of
+        the run, instead of discovering dead proxies one failed scrape at
+        a time.
+
+        Args:
+            test_url (str): URL to test against
+        """
+        working = self.test_all_proxies(test_url)
+        if working:
+            dead = set(self.proxies) - set(working)
+            for proxy in dead:
+                self.proxy_stats.pop(proxy, None)
+            self.proxies = working
+            self._proxy_index = {proxy: i for i, proxy in enumerate(working)}
+            self._round_robin = None
+            self._stats_dirty = True
+            self._save_cached_proxies()
+
+    def get(self) -> Optional[str]:
+        """
+        Get a proxy, favoring the best recent performers.
+
+        Returns:
+            Optional[str]: Proxy URL, or None if the pool is empty
+        """
+        return self.get_next_proxy(strategy='best_performance')
+
+    def record_success(self, proxy: str, response_time: Optional[float] = None):
+        """
+        Record a successful request through a proxy.
+
+        Args:
+            proxy (str): Proxy URL that served the request
+            response_time (float): Request duration in seconds, if measured
+        """
+        with self._stats_lock:
+            stats = self.proxy_stats.get(proxy)
+            if stats is None:
+                return
+            stats.success_count += 1
+            stats.consecutive_fails = 0
+            stats.last_used = time.time()
+            if response_time is not None:
+                stats.avg_response_time = (
+                    (stats.avg_response_time * (stats.success_count - 1)
+                     + response_time) / stats.success_count
+                )
+            self._stats_dirty = True
+
+    def record_failure(self, proxy: str):
+        """
+        Record a failed request through a proxy, ejecting it after
+        _MAX_CONSECUTIVE_FAILS failures in a row.
+
+        Args:
+            proxy (str): Proxy URL that failed
+        """
+        with self._stats_lock:
+            stats = self.proxy_stats.get(proxy)
+            if stats is None:
+                return
+            stats.fail_count += 1
+            stats.consecutive_fails += 1
+            self._stats_dirty = True
+            eject = stats.consecutive_fails >= _MAX_CONSECUTIVE_FAILS
+        if eject:
+            self.remove_proxy(proxy)
+
+    def _load_cached_proxies(self) -> bool:
+        """
+        Load a previously validated pool from disk if it's still fresh.
+
+        Returns:
+            bool: True if a usable cached pool was loaded
+        """
+        try:
+            with open(self.cache_file, 'r') as file:
+                cached = json.load(file)
+            if time.time() - cached.get('saved_at', 0) > _CACHE_MAX_AGE_S:
+                return False
+            proxies = cached.get('proxies', [])
+            if not proxies:
+                return False
+            self.add_proxies(proxies)
+            logger.info(f"Loaded {len(proxies)} validated proxies from cache")
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def _save_cached_proxies(self):
+        """Persist the current pool so restarts skip re-validation."""
+        try:
+            with open(self.cache_file, 'w') as file:
+                json.dump({'saved_at': time.time(), 'proxies': self.proxies}, file)
+        except OSError as e:
+            logger.warning(f"Could not persist proxy cache: {e}")
+
     def remove_proxy(self, proxy: str):
-        """Remove a proxy from the list."""
-        if proxy in self.proxies:
-            self.proxies.remove(proxy)
-            if proxy in self.proxy_stats:
-                del self.proxy_stats[proxy]
-            logger.info(f"Removed proxy: {proxy}")
+        """Remove a proxy from the list in O(1) via swap-with-last."""
+        index = self._proxy_index.pop(proxy, None)
+        if index is None:
+            return
+        last = self.proxies.pop()
+        if last != proxy:
+            # Order doesn't matter to any strategy, so the last entry
+            # fills the hole instead of shifting the tail down
+            self.proxies[index] = last
+            self._proxy_index[last] = index
+        self._round_robin = None
+        self.proxy_stats.pop(proxy, None)
+        self._stats_dirty = True
+        logger.info(f"Removed proxy: {proxy}")
     
     def get_proxy_stats(self) -> Dict[str, Dict]:
-        """Get statistics for all proxies."""
-        return self.proxy_stats.copy()
+        """Get statistics for all proxies as plain dicts."""
+        return {proxy: stats.as_dict()
+                for proxy, stats in self.proxy_stats.items()}
     
-    def _validate_proxy_format(self, proxy: str) -> bool:
-        """Validate proxy URL format."""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _validate_proxy_format(proxy: str) -> bool:
+        """Validate proxy URL format.
+
+        Cached: free-proxy sources repeat addresses across refreshes and
+        cache reloads, so most lookups skip the urlparse entirely.
+        """
         try:
             parsed = urlparse(proxy)
-            return parsed.scheme in ['http', 'https'] and parsed.netloc
+            return parsed.scheme in ('http', 'https') and bool(parsed.netloc)
         except Exception:
             return False
     
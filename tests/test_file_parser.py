@@ -1,59 +1,193 @@
-import unittest
+import base64
+import importlib.util
 import os
+import tempfile
+import unittest
 from file_parser import FileParser
 
+# Minimal one-column xlsx ('url': https://excel.com, https://excel2.com)
+# pre-serialized so setUpClass writes bytes instead of importing pandas
+# and running the openpyxl write path on every test run
+_XLSX_BYTES = base64.b64decode(
+    'UEsDBBQAAAAIAAAAPwBhXUk6TwEAAI8EAAATAAAAW0NvbnRlbnRfVHlwZXNdLnht'
+    'bK2Uy27CMBBF9/2KyNsqMXRRVRWBRR/LFqn0A1x7Qiwc2/IMFP6+k/BQW1Gggk2s'
+    'ZO7cc8eOPBgtG5ctIKENvhT9oicy8DoY66eleJ8853ciQ1LeKBc8lGIFKEbDq8Fk'
+    'FQEzbvZYipoo3kuJuoZGYREieK5UITWK+DVNZVR6pqYgb3q9W6mDJ/CUU+shhoNH'
+    'qNTcUfa05M/rIAkciuxhLWxZpVAxOqsVcV0uvPlFyTeEgjs7DdY24jULhNxLaCt/'
+    'AzZ9r7wzyRrIxirRi2pYJU3Q4xQiStYXh132xAxVZTWwx7zhlgLaQAZMHtkSElnY'
+    'ZT7I1iHB/+HbPWq7TyQunURaOcCzR8WYQBmsAahxxdr0CJn4f4L1s382v7M5AvwM'
+    'afYRwuzSw7Zr0SjrT+B3YpTdcv7UP4Ps/I8dea0SmDdKfA1c/OS/e29zyO4+GX4B'
+    'UEsDBBQAAAAIAAAAPwDyn0na6QAAAEsCAAALAAAAX3JlbHMvLnJlbHOtksFOwzAM'
+    'QO98ReT7mm5ICKGluyCk3SY0PsAkbhu1jaPEg+7viZBADI1pB45x7Odny+vNPI3q'
+    'jVL2HAwsqxoUBcvOh87Ay/5pcQ8qCwaHIwcycKQMm+Zm/UwjSqnJvY9ZFUjIBnqR'
+    '+KB1tj1NmCuOFMpPy2lCKc/U6Yh2wI70qq7vdPrJgOaEqbbOQNq6Jaj9MdI1bG5b'
+    'b+mR7WGiIGda/MooZEwdiYF51O+chlfmoSpQ0OddVte7/D2nnkjQoaC2nGgRU6lO'
+    '4stav3Uc210J58+MS0K3/7kcmoWCI3dZCWP8MtInN9B8AFBLAwQUAAAACAAAAD8A'
+    'RHVb8OgAAAC5AgAAGgAAAHhsL19yZWxzL3dvcmtib29rLnhtbC5yZWxzrZLBasMw'
+    'EETv/Qqx91p2EkopkXMphVzb9AOEtLZMbElot2n99xEJTR0IoQefxIzYmQe7683P'
+    '0IsDJuqCV1AVJQj0JtjOtwo+d2+PzyCItbe6Dx4VjEiwqR/W79hrzjPkukgih3hS'
+    '4Jjji5RkHA6aihDR558mpEFzlqmVUZu9blEuyvJJpmkG1FeZYmsVpK2tQOzGiP/J'
+    'Dk3TGXwN5mtAzzcq5HdIe3KInEN1apEVXCySp6cqcirI2zCLOWE4z+IfyEmezbsM'
+    'yzkZiMc+L/QCcdb36lez1jud0H5wytc2pZjavzDy6uLqI1BLAwQUAAAACAAAAD8A'
+    '5YVUXnABAADmAgAAGAAAAHhsL3dvcmtzaGVldHMvc2hlZXQxLnhtbI2STWvDMAyG'
+    '7/sVxvfV+aDbCElKoZT1MBj7uruJkpgmVrDdZv33k9OthLaHHQyS7OfVK+F08d21'
+    '7ADGKtQZD2cBZ6ALLJWuM/75sb5/4sw6qUvZooaMH8HyRX6XDmh2tgFwjAS0zXjj'
+    'XJ8IYYsGOmln2IOmmwpNJx2lpha2NyDLEepaEQXBg+ik0vykkJj/aGBVqQJWWOw7'
+    '0O4kYqCVjuzbRvWW52mp6M7PwwxUGV+GyTLmIk/Hzl8KBjuJmZPbd2ihcFDS/Jz5'
+    'wbaIO3+5oVLgUXHFrkdTr4aVUMl9695weAZVN45E5uduK+lknhocmBnFbS/9rsIk'
+    'JJ+FLy6pSoz3fciDVByoWUGHmDMY3QR9dRQ94+FtPL6Jx1d4dIGLyQjNsQfTKr2z'
+    'k/h3v2TEJIpWZTZl6Ee/fBBPHkTjOqdyvazhRZpaactaqMhOMHsk4rTMMXbYj9Gc'
+    'sy06h91f1tCHAuMz6lEhur/ENzl/0fwHUEsDBBQAAAAIAAAAPwCDGGolSAEAACYC'
+    'AAAPAAAAeGwvd29ya2Jvb2sueG1sjVHLTsMwELzzFdbeaR5qI1o1qcRLVEKARGnP'
+    'Jt40Vh07sh3S/j3rVClw47Qz493Rznq5OjaKfaF10ugckkkMDHVphNT7HD42j9c3'
+    'wJznWnBlNOZwQger4mrZG3v4NObAaF67HGrv20UUubLGhruJaVHTS2Vswz1Ru49c'
+    'a5ELVyP6RkVpHGdRw6WGs8PC/sfDVJUs8d6UXYPan00sKu5pe1fL1kGxrKTC7TkQ'
+    '4237whta+6iAKe78g5AeRQ5ToqbHP4Lt2ttOqkBm8Qyi4hLyzTKBFe+U39Bqozud'
+    'K52maRY6Q9dWYu9+hgJlx53UwvQ5pFO67GlkyQxYP+CdFL4mIYvnF+0J5b72Ocyz'
+    'LA7m0S/34X5jZXoI9x5wQv8U6pr2J2wXkoBdi2RwGMdKrkpKE8rQmE5nyRxY1Sl1'
+    'R9qrfjZ8MAhDY5LiG1BLAwQUAAAACAAAAD8AFDANpakAAAD1AAAAFAAAAHhsL3No'
+    'YXJlZFN0cmluZ3MueG1sfY5NasMwEIX3OYWYfSzXhRCCpCwKPUFzACFPYoE0cjWj'
+    '4N4+CiWLbrr83g/vmfOWk7pj5VjIwtswgkIKZY50s3D5+twfQbF4mn0qhBZ+kOHs'
+    'doZZVK8SW1hE1pPWHBbMnoeyInXnWmr20rHeNK8V/cwLouSkp3E86OwjgQqlkVh4'
+    'B9Uofjf8eLEzHJ0R12oyWpzRT/yVnnPc93ALmIZQ8r+B6W9C99/uAVBLAwQUAAAA'
+    'CAAAAD8AuOmOWwICAAAbBQAADQAAAHhsL3N0eWxlcy54bWylVNtq3DAQfe9XCL03'
+    'shca0mI7tIWlhTYEsoW+yrbsFdHFSOPF7td3JNtrb9skhbxYM2fmzE0jZ7eDVuQk'
+    'nJfW5DS9SigRprK1NG1Ofxz2b28o8cBNzZU1Iqej8PS2eJN5GJV4OAoBBCMYn9Mj'
+    'QPeBMV8dheb+ynbCoKWxTnNA1bXMd07w2geSVmyXJNdMc2lokTXWgCeV7Q3kdDcD'
+    'ReZ/kRNXWFZKWZFVVllHAMNjHRExXIvJ4zNXsnQygA3XUo0TvAtArGj209JYF0A2'
+    'ZZi+PXs+V/L/yea48fBol0pdNoZAkXUcQDizR4XM8mHsMJXBIU9hot8L3q3jY7p7'
+    'tyHEA/OW1tV4qUvmlC5QkSnRABKcbI/hBNuxYASwGoVa8tYarkLIhTELGLYSSj2E'
+    'm//ZXHQ1NMT0eq/ha51TXKHQ/SJiQbM4hZkU9jQpfZJEeNep8a7XpXD7uFgrGqaz'
+    'ap8ia9U/KtkaLcyGcO8siAri3ifYA19cwnMAWYUrxeGESruzK1G2ehRLB2xo8LMd'
+    'yjSiV0+HDM1rxjSx0797T//Re9x3Npe9ueKLFs4oCc8gp19w/5yS5nGTrOylAmmC'
+    'dhPf0B+cu3Bjau1tS0jORUy5cRGHdYjRCrzEP85FZRijFg3vFRzOxpyu8ndRy16/'
+    'P3vdy5OF2WuVv4WXkF7HCtbfWvEbUEsDBBQAAAAIAAAAPwAY+kZUsAUAAFIbAAAT'
+    'AAAAeGwvdGhlbWUvdGhlbWUxLnhtbO1ZTY/bRBi+8ytGvreOEzvNrpqtNtmkhe22'
+    'q920qMeJPbGnGXusmcluc0PtEQkJURAXJG4cEFCplbiUX7NQBEXqX+D1R5LxZrLN'
+    'tosAtTkknvHzfn/4HefqtQcxQ0dESMqTtuVcrlmIJD4PaBK2rTuD/qWWhaTCSYAZ'
+    'T0jbmhJpXdv64CreVBGJCQLyRG7ithUplW7atvRhG8vLPCUJ3BtxEWMFSxHagcDH'
+    'wDZmdr1Wa9oxpomFEhwD19ujEfUJGmQsra0Z8x6Dr0TJbMNn4tDPJeoUOTYYO9mP'
+    'nMouE+gIs7YFcgJ+PCAPlIUYlgputK1a/rHsrav2nIipFbQaXT//lHQlQTCu53Qi'
+    'HM4Jnb67cWVnzr9e8F/G9Xq9bs+Z88sB2PfBUmcJ6/ZbTmfGUwMVl8u8uzWv5lbx'
+    'Gv/GEn6j0+l4GxV8Y4F3l/CtWtPdrlfw7gLvLevf2e52mxW8t8A3l/D9KxtNt4rP'
+    'QRGjyXgJncVzHpk5ZMTZDSO8BfDWLAEWKFvLroI+UatyLcb3uegDIA8uVjRBapqS'
+    'EfYB18XxUFCcCcCbBGt3ii1fLm1lspD0BU1V2/ooxVARC8ir5z+8ev4UvXr+5OTh'
+    's5OHP588enTy8CcD4Q2chDrhy+8+/+ubT9CfT799+fhLM17q+N9+/PTXX74wA5UO'
+    'fPHVk9+fPXnx9Wd/fP/YAN8WeKjDBzQmEt0ix+iAx2CbQQAZivNRDCJMKxQ4AqQB'
+    '2FNRBXhripkJ1yFV590V0ABMwOuT+xVdDyMxUdQA3I3iCnCPc9bhwmjObiZLN2eS'
+    'hGbhYqLjDjA+Msnungptb5JCJlMTy25EKmruM4g2DklCFMru8TEhBrJ7lFb8ukd9'
+    'wSUfKXSPog6mRpcM6FCZiW7QGOIyNSkIoa74Zu8u6nBmYr9DjqpIKAjMTCwJq7jx'
+    'Op4oHBs1xjHTkTexikxKHk6FX3G4VBDpkDCOegGR0kRzW0wr6u5i6ETGsO+xaVxF'
+    'CkXHJuRNzLmO3OHjboTj1KgzTSId+6EcQ4pitM+VUQlerZBsDXHAycpw36VEna+s'
+    '79AwMidIdmciyq5d6b8xTc5qxoxCN37fjGfwbXg0mUridAtehfsfNt4dPEn2CeT6'
+    '+777vu++i313VS2v220XDdbW5+KcX7xySB5Rxg7VlJGbMm/NEpQO+rCZL3Ki+Uye'
+    'RnBZiqvgQoHzayS4+piq6DDCKYhxcgmhLFmHEqVcwknAWsk7P05SMD7f82ZnQEBj'
+    'tceDYruhnw3nbPJVKHVBjYzBusIaV95OmFMA15TmeGZp3pnSbM2bUA0IZwd/p1kv'
+    'REPGYEaCzO8Fg1lYLjxEMsIBKWPkGA1xGmu6rfV6r2nSNhpvJ22dIOni3BXivAuI'
+    'Um0pSvZyObKkukLHoJVX9yzk47RtjWCSgss4BX4ya0CYhUnb8lVpymuL+bTB5rR0'
+    'aisNrohIhVQ7WEYFVX5r9uokWehf99zMDxdjgKEbradFo+X8i1rYp0NLRiPiqxU7'
+    'i2V5j08UEYdRcIyGbCIOMOjtFtkVUAnPjPpsIaBC3TLxqpVfVsHpVzRldWCWRrjs'
+    'SS0t9gU8v57rkK809ewVur+hKY0LNMV7d03JMhfG1kaQH6hgDBAYZTnatrhQEYcu'
+    'lEbU7wsYHHJZoBeCsshUQix735zpSo4WfavgUTS5MFIHNESCQqdTkSBkX5V2voaZ'
+    'U9efrzNGZZ+ZqyvT4ndIjggbZNXbzOy3UDTrJqUjctzpoNmm6hqG/f/w5OOumHzO'
+    'Hg8WgtzzzCKu1vS1R8HG26lwzkdt3Wxx3Vv7UZvC4QNlX9C4qfDZYr4d8AOIPppP'
+    'lAgS8VKrLL/55hB0bmnGZaz+2TFqEYLWinhf5PCpObuxwtlni3tzZ3sGX3tnu9pe'
+    'LlFbO8jkq6U/nvjwPsjegYPShClZvE16AEfN7uwvA+BjL0i3/gZQSwMEFAAAAAgA'
+    'AAA/ADHnOg7MAAAA2wEAACMAAAB4bC93b3Jrc2hlZXRzL19yZWxzL3NoZWV0MS54'
+    'bWwucmVsc73RwUoDMRAG4LtPEebezXYPItJsL1rowYvUBxiS2d3QZCYkUbZvb0AE'
+    'C0U8eRyG+f4fZrdfY1AflIsXNrDtelDEVpzn2cDb6bB5AFUqssMgTAYuVGA/3u1e'
+    'KWBtN2XxqaiGcDGw1JoetS52oYilk0TcNpPkiLWNedYJ7Rln0kPf3+v804DxylRH'
+    'ZyAf3RbU6ZLoL7ZMk7f0JPY9EtcbEXppUg6ezw3FPFP9YktzabUUOivxe/UirqU+'
+    'r5UyYwB9u97wn/WG3/vpq5+Mn1BLAwQUAAAACAAAAD8ACBkiryUBAABQAgAAEQAA'
+    'AGRvY1Byb3BzL2NvcmUueG1snZLLasMwEEX3/QqjvS0/aAjCdqAtWTVQqEtLd0Ka'
+    'OKLWA0mt47+v4iROAl5lObp3ztwZVK72sov+wDqhVYWyJEURKKa5UG2FPpp1vESR'
+    '81Rx2mkFFRrAoVX9UDJDmLbwZrUB6wW4KICUI8xUaOe9IRg7tgNJXRIcKohbbSX1'
+    'obQtNpT90BZwnqYLLMFTTj3FB2BsJiI6ITmbkObXdiOAMwwdSFDe4SzJ8MXrwUo3'
+    '2zAqV04p/GBg1noWJ/feicnY933SF6M15M/w1+b1fVw1FupwKgaoLjkjzAL12tYl'
+    'vi7C4Trq/CaceCuAPw1Bn3k7LXLsAx6FAOQY96x8Fs8vzRrVeZov4nQZ58smz8lj'
+    'Rors+zDypv8ClKchdxPPgGPu209Q/wNQSwMEFAAAAAgAAAA/AF66p9N3AQAAEAMA'
+    'ABAAAABkb2NQcm9wcy9hcHAueG1snZLBTuswEEX3fEXkPXVSIfRUOUaogFjwRKUW'
+    'WBtn0lg4tuUZopavx0nVkAIrsrozc3V9Mra42rU26yCi8a5kxSxnGTjtK+O2JXva'
+    '3J3/YxmScpWy3kHJ9oDsSp6JVfQBIhnALCU4LFlDFBaco26gVThLY5cmtY+tolTG'
+    'Lfd1bTTceP3egiM+z/NLDjsCV0F1HsZAdkhcdPTX0Mrrng+fN/uQ8qS4DsEarSj9'
+    'pPxvdPToa8pudxqs4NOhSEFr0O/R0F7mgk9LsdbKwjIFy1pZBMG/GuIeVL+zlTIR'
+    'peho0YEmHzM0H2lrc5a9KoQep2SdikY5YgfboRi0DUhRvvj4hg0AoeBjc5BT71Sb'
+    'C1kMhiROjXwESfoUcWPIAj7WKxXpF+JiSjwwsAnjuucrfvAdT/qWvfRtUC4tkI/q'
+    'wbg3fAobf6MIjus8bYp1oyJU6QbGdY8NcZ+4ou39y0a5LVRHz89Bf/nPhwcui/ks'
+    'T99w58ee4F9vWX4CUEsBAhQDFAAAAAgAAAA/AGFdSTpPAQAAjwQAABMAAAAAAAAA'
+    'AAAAAICBAAAAAFtDb250ZW50X1R5cGVzXS54bWxQSwECFAMUAAAACAAAAD8A8p9J'
+    '2ukAAABLAgAACwAAAAAAAAAAAAAAgIGAAQAAX3JlbHMvLnJlbHNQSwECFAMUAAAA'
+    'CAAAAD8ARHVb8OgAAAC5AgAAGgAAAAAAAAAAAAAAgIGSAgAAeGwvX3JlbHMvd29y'
+    'a2Jvb2sueG1sLnJlbHNQSwECFAMUAAAACAAAAD8A5YVUXnABAADmAgAAGAAAAAAA'
+    'AAAAAAAAgIGyAwAAeGwvd29ya3NoZWV0cy9zaGVldDEueG1sUEsBAhQDFAAAAAgA'
+    'AAA/AIMYaiVIAQAAJgIAAA8AAAAAAAAAAAAAAICBWAUAAHhsL3dvcmtib29rLnht'
+    'bFBLAQIUAxQAAAAIAAAAPwAUMA2lqQAAAPUAAAAUAAAAAAAAAAAAAACAgc0GAAB4'
+    'bC9zaGFyZWRTdHJpbmdzLnhtbFBLAQIUAxQAAAAIAAAAPwC46Y5bAgIAABsFAAAN'
+    'AAAAAAAAAAAAAACAgagHAAB4bC9zdHlsZXMueG1sUEsBAhQDFAAAAAgAAAA/ABj6'
+    'RlSwBQAAUhsAABMAAAAAAAAAAAAAAICB1QkAAHhsL3RoZW1lL3RoZW1lMS54bWxQ'
+    'SwECFAMUAAAACAAAAD8AMec6DswAAADbAQAAIwAAAAAAAAAAAAAAgIG2DwAAeGwv'
+    'd29ya3NoZWV0cy9fcmVscy9zaGVldDEueG1sLnJlbHNQSwECFAMUAAAACAAAAD8A'
+    'CBkiryUBAABQAgAAEQAAAAAAAAAAAAAAgIHDEAAAZG9jUHJvcHMvY29yZS54bWxQ'
+    'SwECFAMUAAAACAAAAD8AXrqn03cBAAAQAwAAEAAAAAAAAAAAAAAAgIEXEgAAZG9j'
+    'UHJvcHMvYXBwLnhtbFBLBQYAAAAACwALANECAAC8EwAAAAA='
+)
+
+
 class TestFileParser(unittest.TestCase):
-    def setUp(self):
-        self.parser = FileParser()
-        # Create test files
-        with open('test_urls.txt', 'w') as f:
+    @classmethod
+    def setUpClass(cls):
+        # Fixtures are identical for every test, so build them once per
+        # class in a temp dir instead of rewriting five files per test
+        cls.parser = FileParser()
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.txt_path = os.path.join(cls._tmp.name, 'test_urls.txt')
+        cls.csv_path = os.path.join(cls._tmp.name, 'test_urls.csv')
+        cls.txt2_path = os.path.join(cls._tmp.name, 'test_urls2.txt')
+        cls.xlsx_path = os.path.join(cls._tmp.name, 'test_urls.xlsx')
+        cls.docx_path = os.path.join(cls._tmp.name, 'test_urls.docx')
+        with open(cls.txt_path, 'w') as f:
             f.write('https://example.com\nhttps://test.com\n')
-        with open('test_urls.csv', 'w') as f:
+        with open(cls.csv_path, 'w') as f:
             f.write('url\nhttps://csv.com\nhttps://csv2.com\n')
-        with open('test_urls2.txt', 'w') as f:
+        with open(cls.txt2_path, 'w') as f:
             f.write('Some text https://inline.com and more text\n')
-        # Create a minimal Excel file if pandas is available
-        try:
-            import pandas as pd
-            df = pd.DataFrame({'url': ['https://excel.com', 'https://excel2.com']})
-            df.to_excel('test_urls.xlsx', index=False)
-            self.has_pandas = True
-        except ImportError:
-            self.has_pandas = False
+        # The xlsx is pre-serialized above; pandas is only needed to
+        # read it back, so probe for it without importing
+        cls.has_pandas = importlib.util.find_spec('pandas') is not None
+        if cls.has_pandas:
+            with open(cls.xlsx_path, 'wb') as f:
+                f.write(_XLSX_BYTES)
         # Create a minimal DOCX file
         try:
             from docx import Document
             doc = Document()
             doc.add_paragraph('https://docx.com')
-            doc.save('test_urls.docx')
-            self.has_docx = True
+            doc.save(cls.docx_path)
+            cls.has_docx = True
         except ImportError:
-            self.has_docx = False
+            cls.has_docx = False
 
-    def tearDown(self):
-        for fname in [
-            'test_urls.txt', 'test_urls.csv', 'test_urls2.txt',
-            'test_urls.xlsx', 'test_urls.docx']:
-            if os.path.exists(fname):
-                os.remove(fname)
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
 
     def test_parse_txt(self):
-        urls = self.parser.parse_file('test_urls.txt')
+        urls = self.parser.parse_file(self.txt_path)
         self.assertIn('https://example.com', urls)
         self.assertIn('https://test.com', urls)
 
     def test_parse_csv(self):
-        urls = self.parser.parse_file('test_urls.csv')
+        urls = self.parser.parse_file(self.csv_path)
         self.assertIn('https://csv.com', urls)
         self.assertIn('https://csv2.com', urls)
 
     def test_parse_txt_inline(self):
-        urls = self.parser.parse_file('test_urls2.txt')
+        urls = self.parser.parse_file(self.txt2_path)
         self.assertIn('https://inline.com', urls)
 
     def test_parse_excel(self):
         if self.has_pandas:
-            urls = self.parser.parse_file('test_urls.xlsx')
+            urls = self.parser.parse_file(self.xlsx_path)
             self.assertIn('https://excel.com', urls)
             self.assertIn('https://excel2.com', urls)
         else:
@@ -61,16 +195,16 @@ class TestFileParser(unittest.TestCase):
 
     def test_parse_docx(self):
         if self.has_docx:
-            urls = self.parser.parse_file('test_urls.docx')
+            urls = self.parser.parse_file(self.docx_path)
             self.assertIn('https://docx.com', urls)
         else:
             self.skipTest('python-docx not available')
 
     def test_file_info(self):
-        info = self.parser.get_file_info('test_urls.txt')
+        info = self.parser.get_file_info(self.txt_path)
         self.assertEqual(info['extension'], '.txt')
         self.assertTrue(info['size_bytes'] > 0)
         self.assertTrue(info['exists'])
 
 if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,76 @@
+import importlib.util
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from main import EmailScraper, ScrapeResult
+
+
+def _make_scraper():
+    # The summary helpers only read the settings attributes, so skip the
+    # full component spin-up (browser, output dir) that __init__ does
+    scraper = EmailScraper.__new__(EmailScraper)
+    scraper.use_selenium = False
+    scraper.use_proxies = False
+    scraper.use_social_scraping = False
+    scraper.max_internal_pages = 5
+    scraper.output_format = 'csv'
+    return scraper
+
+
+class TestSummaryDetailedResults(unittest.TestCase):
+    def setUp(self):
+        self.scraper = _make_scraper()
+        self.results = [
+            ScrapeResult(url='https://example.com', status='success',
+                         emails=['a@example.com', 'b@example.com'],
+                         source_page='https://example.com'),
+            ScrapeResult(url='https://fail.com', status='failed',
+                         error='Timeout'),
+        ]
+
+    def test_summary_exposes_per_url_records(self):
+        summary = self.scraper._create_summary(self.results, {})
+        self.assertEqual(summary['detailed_results'], self.results)
+        self.assertEqual(summary['total_emails_found'], 2)
+
+    def test_empty_results_expose_empty_records(self):
+        summary = self.scraper._create_empty_results()
+        self.assertEqual(summary['detailed_results'], [])
+
+
+class TestResultsStore(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if importlib.util.find_spec('streamlit') is None:
+            raise unittest.SkipTest('streamlit not available')
+        import app
+        cls.app = app
+
+    def test_scrape_summary_rows_reach_store(self):
+        scraper = _make_scraper()
+        results = [
+            ScrapeResult(url='https://example.com', status='success',
+                         emails=['a@example.com', 'b@example.com'],
+                         source_page='https://example.com'),
+            ScrapeResult(url='https://fail.com', status='failed',
+                         error='Timeout'),
+        ]
+        summary = scraper._create_summary(results, {})
+
+        db_path = os.path.join(tempfile.mkdtemp(), 'results.db')
+        original = self.app.RESULTS_DB_PATH
+        self.app.RESULTS_DB_PATH = db_path
+        try:
+            self.app.store_results_in_db(summary)
+            total, distinct = self.app.count_results_in_db()
+        finally:
+            self.app.RESULTS_DB_PATH = original
+        # Two email rows plus one empty row for the failed URL
+        self.assertEqual(total, 3)
+        self.assertEqual(distinct, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()